@@ -0,0 +1,527 @@
+"""
+Class to run many games of snake at once with NumPy
+"""
+
+import numpy as np
+from snake import COL_STEPS, DIRECTION_CODES, ROW_STEPS
+from snake_game_model import SnakeGameModel
+
+# ROW_STEPS and COL_STEPS as arrays, to look up the steps of many codes at once
+_ROW_STEPS = np.array(ROW_STEPS, dtype=np.int32)
+_COL_STEPS = np.array(COL_STEPS, dtype=np.int32)
+
+# Rounds of rejection sampling before falling back to listing free cells
+_SAMPLING_ROUNDS = 16
+
+
+def _starting_arrays(template, capacity):
+    """
+    Builds the arrays every game of a batch is reset to from a game model
+
+    Parameters:
+        template: An instance of the SnakeGameModel class set up at the
+            starting position
+        capacity: int representing how many segments each snake can hold
+
+    Returns:
+        dict of the rows, cols and direction codes of the segments of each
+        snake padded to the capacity, the starting length, the cell of each
+        apple, the occupancy of each cell and the apple on each cell, or -1
+    """
+    width = template.board_width
+    height = template.board_height
+    rows = np.zeros((template.num_snakes, capacity), dtype=np.int32)
+    cols = np.zeros_like(rows)
+    codes = np.zeros((template.num_snakes, capacity), dtype=np.int8)
+    occupancy = np.zeros(width * height, dtype=np.int16)
+    for index, snake in enumerate(template.snakes):
+        locations = np.array(snake.locations, dtype=np.int32)
+        rows[index, : len(snake)] = locations[:, 0]
+        cols[index, : len(snake)] = locations[:, 1]
+        codes[index, : len(snake)] = [
+            DIRECTION_CODES[direction] for direction in snake.directions
+        ]
+        for row, col in snake.locations:
+            if 0 <= row < height and 0 <= col < width:
+                occupancy[row * width + col] += 1
+    apples = np.array(
+        [row * width + col for row, col in template.apples], dtype=np.int32
+    )
+    apple_grid = np.full(width * height, -1, dtype=np.int32)
+    apple_grid[apples] = np.arange(len(apples))
+    return {
+        "rows": rows,
+        "cols": cols,
+        "codes": codes,
+        "length": template.snake_starting_length,
+        "apples": apples,
+        "occupancy": occupancy,
+        "apple_grid": apple_grid,
+    }
+
+
+# The arrays of every game are kept apart so each step works on whole arrays
+# pylint: disable-next=too-many-instance-attributes
+class BatchedSnakeGameModel:
+    """
+    Class to store and advance a batch of independent snake games in lockstep
+
+    Every game follows the rules of SnakeGameModel: all snakes move at once,
+    eat and grow, eaten apples respawn on a uniformly random free cell, and a
+    head dies if it leaves the board or lands on any segment. A game ends on
+    the first tick a snake dies or eats enough apples, and is then reset to
+    the starting position before step returns.
+
+    Each snake body is a ring buffer along the last axis of the rows, cols
+    and codes arrays, stored head first from its start slot. The buffer is
+    long enough for the snake to reach the winning length, so it never has to
+    grow. Boards are flattened to row major cell indexes.
+
+    Directions are the integer codes of snake.DIRECTIONS (UP=0, DOWN=1,
+    LEFT=2, RIGHT=3).
+
+    Attributes:
+        num_games: int representing how many games are in the batch
+        num_snakes: int representing how many snakes play each game
+        board_width: int representing width of each game board
+        board_height: int representing height of each game board
+        apples_to_win: int representing how many apples a snake must eat
+        to win
+        heads: array of ints with the row and col of each snake head
+        lengths: array of ints with the length of each snake
+        apples_eaten: array of ints with the apples eaten by each snake
+        apples: array of ints with the row and col of each apple
+        games_played: int representing how many games have finished
+    """
+
+    # The options match SnakeGameModel and are keyword only
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        num_games,
+        *,
+        board_width=19,
+        board_height=19,
+        snake_starting_length=4,
+        num_apples=1,
+        apples_to_win=10,
+        num_snakes=2,
+        seed=None,
+    ):
+        """
+        Creates an instance of the BatchedSnakeGameModel class
+
+        Parameters:
+            num_games: int representing how many games are in the batch
+            board_width: int representing width of each game board
+            board_height: int representing height of each game board
+            snake_starting_length: int representing how long snakes start as
+            num_apples: int representing how many apples on each board
+            apples_to_win: int representing how many apples a snake must eat
+            to win
+            num_snakes: int representing how many snakes play each game
+            seed: int used to seed apple respawns, or None for a random seed
+        """
+        self._num_games = num_games
+        self._num_snakes = num_snakes
+        self._board_width = board_width
+        self._board_height = board_height
+        self._apples_to_win = apples_to_win
+        self._capacity = snake_starting_length + apples_to_win
+        self._rng = np.random.default_rng(seed)
+        self._games_played = 0
+
+        # Every game starts from the position of a single game model
+        template = SnakeGameModel(
+            board_width=board_width,
+            board_height=board_height,
+            snake_starting_length=snake_starting_length,
+            num_apples=num_apples,
+            apples_to_win=apples_to_win,
+            num_snakes=num_snakes,
+        )
+        self._starting = _starting_arrays(template, self._capacity)
+
+        num_cells = board_width * board_height
+        shape = (num_games, num_snakes)
+        self._rows = np.zeros(shape + (self._capacity,), dtype=np.int32)
+        self._cols = np.zeros_like(self._rows)
+        self._codes = np.zeros(shape + (self._capacity,), dtype=np.int8)
+        self._start = np.zeros(shape, dtype=np.int32)
+        self._length = np.zeros(shape, dtype=np.int32)
+        self._apples_eaten = np.zeros(shape, dtype=np.int32)
+        self._occupancy = np.zeros((num_games, num_cells), dtype=np.int16)
+        self._apples = np.zeros((num_games, num_apples), dtype=np.int32)
+        # Index of the apple on each cell, or -1
+        self._apple_grid = np.full((num_games, num_cells), -1, dtype=np.int32)
+
+        self._games = np.arange(num_games)[:, None]
+        self._snakes = np.arange(num_snakes)[None, :]
+        self._reset_games(np.ones(num_games, dtype=bool))
+
+    def reset(self):
+        """
+        Resets every game in the batch to the starting position
+        """
+        self._reset_games(np.ones(self._num_games, dtype=bool))
+
+    def _reset_games(self, finished):
+        """
+        Resets some games to the starting position
+
+        Parameters:
+            finished: array of bools, true for each game to reset
+        """
+        games = np.flatnonzero(finished)
+        if len(games) == 0:
+            return
+        starting = self._starting
+        self._rows[games] = starting["rows"]
+        self._cols[games] = starting["cols"]
+        self._codes[games] = starting["codes"]
+        self._start[games] = 0
+        self._length[games] = starting["length"]
+        self._apples_eaten[games] = 0
+
+        self._occupancy[games] = starting["occupancy"]
+        self._apple_grid[games] = starting["apple_grid"]
+        self._apples[games] = starting["apples"]
+
+    def _in_bounds(self, rows, cols):
+        """
+        Checks whether locations are on the board
+
+        Parameters:
+            rows: array of ints with the row of each location
+            cols: array of ints with the col of each location
+
+        Returns:
+            array of bools: whether each location is on the board
+        """
+        return (
+            (rows >= 0)
+            & (rows < self._board_height)
+            & (cols >= 0)
+            & (cols < self._board_width)
+        )
+
+    def _add_segments(self, rows, cols, amount, mask):
+        """
+        Adds to the occupancy of the cells of some segments
+
+        Parameters:
+            rows: array of shape (num_games, num_snakes) with segment rows
+            cols: array of shape (num_games, num_snakes) with segment cols
+            amount: int to add to the occupancy of each cell
+            mask: array of bools, true for each segment to count
+        """
+        mask = mask & self._in_bounds(rows, cols)
+        games = np.broadcast_to(self._games, mask.shape)[mask]
+        np.add.at(
+            self._occupancy,
+            (games, rows[mask] * self._board_width + cols[mask]),
+            amount,
+        )
+
+    def step(self, actions):
+        """
+        Advances every game by one tick
+
+        Parameters:
+            actions: array of ints of shape (num_games, num_snakes) with the
+            direction code for each snake to move in
+
+        Returns:
+            array of bools of shape (num_games, num_snakes) with whether each
+            snake won, all false for games that have not ended
+            array of bools of shape (num_games,) with whether each game ended
+            and was reset
+        """
+        games, snakes = self._games, self._snakes
+        everyone = np.ones((self._num_games, self._num_snakes), dtype=bool)
+        actions = np.asarray(actions, dtype=np.int8)
+
+        # A snake cannot turn back on itself
+        head_codes = self._codes[games, snakes, self._start]
+        codes = np.where(actions ^ 1 == head_codes, head_codes, actions)
+
+        # Move every snake, freeing the tail before placing the new head
+        tail_slots = (self._start + self._length - 1) % self._capacity
+        self._add_segments(
+            self._rows[games, snakes, tail_slots],
+            self._cols[games, snakes, tail_slots],
+            -1,
+            everyone,
+        )
+        head_rows = self._rows[games, snakes, self._start] + _ROW_STEPS[codes]
+        head_cols = self._cols[games, snakes, self._start] + _COL_STEPS[codes]
+        self._start = (self._start - 1) % self._capacity
+        self._rows[games, snakes, self._start] = head_rows
+        self._cols[games, snakes, self._start] = head_cols
+        self._codes[games, snakes, self._start] = codes
+        self._add_segments(head_rows, head_cols, 1, everyone)
+
+        self._check_and_eat(head_rows, head_cols)
+        winners, finished = self._outcomes(head_rows, head_cols)
+
+        self._games_played += int(finished.sum())
+        self._reset_games(finished)
+        return winners, finished
+
+    def _outcomes(self, head_rows, head_cols):
+        """
+        Finds the games that ended this tick and the snakes that won them
+
+        Parameters:
+            head_rows: array of shape (num_games, num_snakes) with head rows
+            head_cols: array of shape (num_games, num_snakes) with head cols
+
+        Returns:
+            array of bools of shape (num_games, num_snakes) with whether each
+            snake won, all false for games that have not ended
+            array of bools of shape (num_games,) with whether each game ended
+        """
+        # A head dies off the board or on a cell shared with another segment
+        on_board = self._in_bounds(head_rows, head_cols)
+        head_cells = np.where(
+            on_board, head_rows * self._board_width + head_cols, 0
+        )
+        dead = ~on_board | (self._occupancy[self._games, head_cells] > 1)
+
+        full = self._apples_eaten >= self._apples_to_win
+        any_dead = dead.any(axis=1, keepdims=True)
+        winners = np.where(
+            dead.all(axis=1, keepdims=True),
+            True,
+            np.where(any_dead, ~dead, full),
+        )
+        finished = any_dead[:, 0] | full.any(axis=1)
+        winners &= finished[:, None]
+        return winners, finished
+
+    def _check_and_eat(self, head_rows, head_cols):
+        """
+        Grows the snakes whose heads are on apples and respawns those apples
+
+        Parameters:
+            head_rows: array of shape (num_games, num_snakes) with head rows
+            head_cols: array of shape (num_games, num_snakes) with head cols
+        """
+        on_board = self._in_bounds(head_rows, head_cols)
+        head_cells = np.where(
+            on_board, head_rows * self._board_width + head_cols, 0
+        )
+        eaten = np.where(
+            on_board, self._apple_grid[self._games, head_cells], -1
+        )
+        ate = eaten >= 0
+        if not ate.any():
+            return
+        self._grow(ate)
+
+        # Each eaten apple respawns once, even if two snakes ate it
+        eaten_apples = np.unique(
+            np.stack([np.nonzero(ate)[0], eaten[ate]], axis=1), axis=0
+        )
+        apple_games, apple_indexes = eaten_apples[:, 0], eaten_apples[:, 1]
+        old_cells = self._apples[apple_games, apple_indexes]
+        self._apple_grid[apple_games, old_cells] = -1
+        self._respawn(apple_games, apple_indexes)
+
+    def _grow(self, ate):
+        """
+        Adds a segment behind the tail of each snake that ate
+
+        Parameters:
+            ate: array of bools of shape (num_games, num_snakes), true for
+            each snake to grow
+        """
+        games, snakes = self._games, self._snakes
+        tail_slots = (self._start + self._length - 1) % self._capacity
+        tail_codes = self._codes[games, snakes, tail_slots]
+        new_slots = (tail_slots + 1) % self._capacity
+        new_rows = (
+            self._rows[games, snakes, tail_slots] + _ROW_STEPS[tail_codes ^ 1]
+        )
+        new_cols = (
+            self._cols[games, snakes, tail_slots] + _COL_STEPS[tail_codes ^ 1]
+        )
+        game_index, snake_index = np.nonzero(ate)
+        grow_slots = new_slots[ate]
+        self._rows[game_index, snake_index, grow_slots] = new_rows[ate]
+        self._cols[game_index, snake_index, grow_slots] = new_cols[ate]
+        self._codes[game_index, snake_index, grow_slots] = tail_codes[ate]
+        self._length += ate
+        self._apples_eaten += ate
+        self._add_segments(new_rows, new_cols, 1, ate)
+
+    def _respawn(self, apple_games, apple_indexes):
+        """
+        Moves apples to uniformly random cells with no snake or apple on them
+
+        Cells are drawn at random until a free one is found, falling back to
+        choosing from the list of free cells on very full boards.
+
+        Parameters:
+            apple_games: array of ints with the game of each apple to move
+            apple_indexes: array of ints with the index of each apple to move
+        """
+        num_cells = self._board_width * self._board_height
+        pending = np.arange(len(apple_games))
+        for _ in range(_SAMPLING_ROUNDS):
+            if len(pending) == 0:
+                return
+            games = apple_games[pending]
+            cells = self._rng.integers(0, num_cells, size=len(pending))
+            free = (self._occupancy[games, cells] == 0) & (
+                self._apple_grid[games, cells] == -1
+            )
+            # Only one apple can take a cell, so keep the first of any
+            # apples in the same game that drew the same cell
+            _, first = np.unique(
+                np.stack([games, cells], axis=1), axis=0, return_index=True
+            )
+            chosen = np.zeros(len(pending), dtype=bool)
+            chosen[first] = True
+            placed = free & chosen
+            self._place_apples(
+                games[placed], apple_indexes[pending[placed]], cells[placed]
+            )
+            pending = pending[~placed]
+
+        for index in pending:
+            game = apple_games[index]
+            free_cells = np.flatnonzero(
+                (self._occupancy[game] == 0) & (self._apple_grid[game] == -1)
+            )
+            cell = self._rng.choice(free_cells)
+            self._place_apples(
+                np.array([game]),
+                apple_indexes[index : index + 1],
+                np.array([cell]),
+            )
+
+    def _place_apples(self, games, apple_indexes, cells):
+        """
+        Puts apples on cells
+
+        Parameters:
+            games: array of ints with the game of each apple
+            apple_indexes: array of ints with the index of each apple
+            cells: array of ints with the cell to put each apple on
+        """
+        self._apples[games, apple_indexes] = cells
+        self._apple_grid[games, cells] = apple_indexes
+
+    def locations(self, game, snake):
+        """
+        Gets the segments of one snake, like Snake.locations
+
+        Parameters:
+            game: int representing which game the snake is in
+            snake: int representing which snake in the game
+
+        Returns:
+            list of lists of ints with the row and col of each segment from
+            head to tail
+        """
+        slots = (
+            self._start[game, snake] + np.arange(self._length[game, snake])
+        ) % self._capacity
+        return np.stack(
+            [self._rows[game, snake, slots], self._cols[game, snake, slots]],
+            axis=1,
+        ).tolist()
+
+    @property
+    def num_games(self):
+        """
+        Returns the number of games in the batch as an int
+        """
+        return self._num_games
+
+    @property
+    def num_snakes(self):
+        """
+        Returns the number of snakes in each game as an int
+        """
+        return self._num_snakes
+
+    @property
+    def board_width(self):
+        """
+        Returns the board width as an int
+        """
+        return self._board_width
+
+    @property
+    def board_height(self):
+        """
+        Returns the board height as an int
+        """
+        return self._board_height
+
+    @property
+    def apples_to_win(self):
+        """
+        Returns the number of apples a snake must eat to win as an int
+        """
+        return self._apples_to_win
+
+    @property
+    def heads(self):
+        """
+        Returns the row and col of each snake head as an int array of shape
+        (num_games, num_snakes, 2)
+        """
+        return np.stack(
+            [
+                self._rows[self._games, self._snakes, self._start],
+                self._cols[self._games, self._snakes, self._start],
+            ],
+            axis=-1,
+        )
+
+    @property
+    def head_directions(self):
+        """
+        Returns the direction code of each snake head as an int array of
+        shape (num_games, num_snakes)
+        """
+        return self._codes[self._games, self._snakes, self._start]
+
+    @property
+    def lengths(self):
+        """
+        Returns the length of each snake as an int array of shape
+        (num_games, num_snakes)
+        """
+        return self._length.copy()
+
+    @property
+    def apples_eaten(self):
+        """
+        Returns the apples eaten by each snake as an int array of shape
+        (num_games, num_snakes)
+        """
+        return self._apples_eaten.copy()
+
+    @property
+    def apples(self):
+        """
+        Returns the row and col of each apple as an int array of shape
+        (num_games, num_apples, 2)
+        """
+        return np.stack(
+            [
+                self._apples // self._board_width,
+                self._apples % self._board_width,
+            ],
+            axis=-1,
+        )
+
+    @property
+    def games_played(self):
+        """
+        Returns the number of games that have finished as an int
+        """
+        return self._games_played
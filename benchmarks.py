@@ -0,0 +1,518 @@
+"""
+Benchmarks for the hot paths of the snake game
+
+Run `python benchmarks.py` to time every benchmark, `--save FILE` to store
+the results as a baseline and `--compare FILE` to fail (exit status 1) when
+a benchmark is slower than the baseline by more than `--threshold`. Every
+result is a cost, so lower is better: seconds per call, except for memory
+results, which are bytes.
+
+The view benchmarks draw into a hidden window using SDL's dummy video
+driver, so they run without a display.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+from functools import lru_cache
+from snake import Snake
+from snake_game_model import SnakeGameModel
+
+# Moves that keep a head circling a two by two square, so long snakes keep
+# ticking without running off the board
+_LOOP_MOVES = ["UP", "LEFT", "DOWN", "RIGHT"]
+
+# Slowdown relative to the baseline above which a benchmark has regressed
+DEFAULT_THRESHOLD = 0.25
+
+# Runs of a batched benchmark made before timing it
+_WARMUP_RUNS = 20
+
+# Name of the result timing a fixed workload, used to factor out a machine
+# that is faster or slower overall than when the baseline was saved
+CALIBRATION = "calibration"
+
+
+def _serpentine(length, first_row, width):
+    """
+    Builds the body of a snake that zig zags row by row across the board
+
+    Parameters:
+        length: Integer greater than 0 representing the length of the snake
+        first_row: Integer representing the row of the head
+        width: Integer representing the width of the board
+
+    Returns:
+        list of lists of ints with the coordinates of each segment
+        list of strings with the direction of each segment
+    """
+    locations = []
+    directions = []
+    for i in range(length):
+        row = first_row + i // width
+        if (i // width) % 2 == 0:
+            locations.append([row, width - 1 - i % width])
+            directions.append("RIGHT")
+        else:
+            locations.append([row, i % width])
+            directions.append("LEFT")
+    return locations, directions
+
+
+def _long_snake_game(length, size=19):
+    """
+    Builds a game with two long snakes filling the top and bottom halves of
+    the board
+
+    Parameters:
+        length: Integer greater than 0 representing the length of each snake
+        size: Integer representing the width and height of the board
+
+    Returns:
+        SnakeGameModel: the game
+    """
+    snake_one = _serpentine(length, 1, size)
+    snake_two = _serpentine(length, size // 2 + 1, size)
+    return SnakeGameModel(
+        snake_one_locations=snake_one[0],
+        snake_one_directions=snake_one[1],
+        snake_two_locations=snake_two[0],
+        snake_two_directions=snake_two[1],
+        board_width=size,
+        board_height=size,
+    )
+
+
+def _ticker(game):
+    """
+    Makes a function that plays one tick of a game and checks for a winner
+
+    Parameters:
+        game: An instance of the SnakeGameModel class
+
+    Returns:
+        function taking no arguments
+    """
+    moves = [[move] * game.num_snakes for move in _LOOP_MOVES]
+    steps = [0]
+
+    def tick():
+        steps[0] += 1
+        game.move_snakes(*moves[steps[0] % len(moves)])
+        game.snake_won()
+
+    return tick
+
+
+def _measure(function, number, repeat=5):
+    """
+    Times a function, keeping the fastest of several runs to reduce noise
+
+    Parameters:
+        function: function taking no arguments to time
+        number: Integer representing the calls to make in each run
+        repeat: Integer representing the number of runs
+
+    Returns:
+        float: seconds per call in the fastest run
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def _nothing(*_):
+    """
+    Does nothing, to time the loop around a function being measured
+    """
+
+
+def _calibration_workload():
+    """
+    Does a fixed amount of pure Python work that no change to the game affects
+    """
+    total = 0
+    for i in range(1000):
+        total += i * i % 7
+    return total
+
+
+@lru_cache(maxsize=None)
+def _run_calibration():
+    """
+    Times the calibration workload once per run
+
+    Returns:
+        float: seconds the calibration workload takes
+    """
+    return _measure(_calibration_workload, 200)
+
+
+def _measure_batched(function, arguments, repeat=200):
+    """
+    Times a function too fast to time one call at a time
+
+    Each run calls the function in a loop, then the same loop calling a
+    function that does nothing, then the calibration workload, all within a
+    few milliseconds. The speed of a busy machine drifts over seconds, so
+    each run's cost less its loop is taken relative to its own calibration,
+    and the median of these is scaled to the calibration result of the
+    benchmarks.
+
+    Parameters:
+        function: function to time
+        arguments: list of tuples of the arguments of each call
+        repeat: Integer representing the number of runs
+
+    Returns:
+        float: seconds per call, less the loop, at the speed the calibration
+        result was measured at
+    """
+    ratios = []
+    # The first runs warm up the interpreter and the CPU, so are left out
+    for run in range(_WARMUP_RUNS + repeat):
+        start = time.perf_counter()
+        for args in arguments:
+            function(*args)
+        called = time.perf_counter()
+        for args in arguments:
+            _nothing(*args)
+        looped = time.perf_counter()
+        _calibration_workload()
+        calibrated = time.perf_counter()
+        if run >= _WARMUP_RUNS:
+            ratios.append((2 * called - start - looped) / (calibrated - looped))
+    cost = max(statistics.median(ratios), 0.0) / len(arguments)
+    return cost * _run_calibration()
+
+
+def _snake_cases():
+    """
+    Yields the Snake benchmarks
+
+    Yields:
+        tuple of the benchmark name and its cost
+    """
+    for length in (4, 1000, 100000):
+        snake = Snake([length + 5, 5], "DOWN", length)
+        moves = [(move,) for move in _LOOP_MOVES * 500]
+        yield (
+            f"snake.move[length={length}]",
+            _measure_batched(snake.move, moves),
+        )
+
+        snake = Snake([length + 5, 5], "DOWN", length)
+        yield (
+            f"snake.grow[length={length}]",
+            _measure_batched(snake.grow, [()] * 2000),
+        )
+
+    tracemalloc.start()
+    Snake([100005, 5], "DOWN", 100000)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    yield "snake.memory_bytes_per_segment[length=100000]", peak / 100000
+
+
+def _model_cases():
+    """
+    Yields the SnakeGameModel benchmarks
+
+    Yields:
+        tuple of the benchmark name and its cost
+    """
+    # pylint: disable=protected-access
+    for length in (4, 162):
+        game = _long_snake_game(length)
+        yield (
+            f"model.move_snakes[length={length}]",
+            _measure(_ticker(game), 2000),
+        )
+        yield (
+            f"model.new_apple[length={length}]",
+            _measure(lambda game=game: game._new_apple(0), 2000),
+        )
+    yield "model.snake_won", _measure(game.snake_won, 20000)
+
+    for size in (19, 100, 1000):
+        game = SnakeGameModel(
+            board_width=size,
+            board_height=size,
+            num_apples=min(200, size * size // 4),
+        )
+        yield (
+            f"model.move_snakes[board={size}]",
+            _measure(_ticker(game), 2000),
+        )
+        yield (
+            f"model.new_apple[board={size}]",
+            _measure(lambda game=game: game._new_apple(0), 2000),
+        )
+        yield f"model.reset[board={size}]", _measure(game.reset, 3)
+        yield f"model.repr[board={size}]", _measure(
+            lambda game=game: repr(game), 3
+        )
+
+    for count in (2, 8, 32):
+        game = SnakeGameModel(
+            board_width=100, board_height=100, num_snakes=count
+        )
+        yield (
+            f"model.move_snakes[snakes={count}]",
+            _measure(_ticker(game), 1000),
+        )
+
+
+def _batched_cases():
+    """
+    Yields the BatchedSnakeGameModel benchmarks, costed per game tick
+
+    Yields:
+        tuple of the benchmark name and its cost
+    """
+    # Imported here so the other benchmarks run without NumPy
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+    from batched_snake_game_model import BatchedSnakeGameModel
+
+    num_games = 4096
+    batch = BatchedSnakeGameModel(num_games, seed=0)
+    actions = np.random.default_rng(0).integers(0, 4, size=(num_games, 2))
+    yield (
+        f"batched.step[games={num_games}]",
+        _measure(lambda: batch.step(actions), 50) / num_games,
+    )
+
+
+def _bot_cases():
+    """
+    Yields the find_move benchmarks, with the apple in the far corner
+
+    Boards are kept small enough for the search to finish within its time
+    budget, as a search cut short takes the budget on any machine.
+
+    Yields:
+        tuple of the benchmark name and its cost
+    """
+    # pylint: disable=import-outside-toplevel
+    from snake_game_bot_controller import find_move
+
+    for size in (19, 100):
+        game = SnakeGameModel(board_width=size, board_height=size)
+        game.apples[0][:] = [0, size - 1]
+        yield (
+            f"bot.find_move[board={size}]",
+            _measure(lambda game=game: find_move(game, 0), 200),
+        )
+
+
+def _redraw(view, draw):
+    """
+    Draws a view from scratch, as when the game state changes, since a view
+    with nothing new to draw returns at once
+
+    Parameters:
+        view: An instance of the GraphicalView class
+        draw: function taking no arguments that draws the view
+    """
+    # pylint: disable=protected-access
+    view._drawn_state = None
+    draw()
+
+
+def _pygame_cases():
+    """
+    Yields the GraphicalController and GraphicalView benchmarks
+
+    Yields:
+        tuple of the benchmark name and its cost
+    """
+    # Imported here so the other benchmarks run without pygame
+    # pylint: disable=import-outside-toplevel
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from snake_game_graphical_controller import GraphicalController
+    from snake_game_graphical_view import GraphicalView
+
+    game = SnakeGameModel()
+    controller = GraphicalController(game)
+
+    def move():
+        controller.move()
+        game.reset()
+
+    yield "controller.move", _measure(move, 2000)
+
+    view = GraphicalView(game, 1400, 1050)
+    game.set_game_state(2)
+    tick = _ticker(game)
+
+    def tick_and_draw():
+        tick()
+        view.draw(0)
+
+    yield "view.tick_and_draw[running]", _measure(tick_and_draw, 200)
+
+    from snake_game_cell_view import CellView
+    from snake_game_offscreen_view import OffscreenView
+
+    offscreen = OffscreenView(game, 1400, 1050)
+    offscreen.draw()
+    yield (
+        "offscreen.draw[running]",
+        _measure(lambda: _redraw(offscreen, offscreen.draw), 200),
+    )
+    yield "offscreen.frame", _measure(lambda: offscreen.frame, 2000)
+    cells = CellView(game)
+    yield "cells.draw[running]", _measure(cells.draw, 2000)
+
+    for state, name in ((1, "start"), (2, "running"), (3, "end")):
+        game.set_game_state(state)
+        if name == "end":
+            # Run both snakes into the walls so the tie screen is drawn
+            while True not in game.snake_won():
+                game.move_snakes(*(snake.direction for snake in game.snakes))
+        # A frame rate of 0 draws without waiting for the next frame
+        yield (
+            f"view.draw[{name}]",
+            _measure(lambda: _redraw(view, lambda: view.draw(0)), 20),
+        )
+
+
+# Groups of benchmarks by name, in the order they run
+CASES = {
+    "snake": _snake_cases,
+    "model": _model_cases,
+    "batched": _batched_cases,
+    "bot": _bot_cases,
+    "pygame": _pygame_cases,
+}
+
+
+def run_benchmarks(groups=None):
+    """
+    Runs benchmarks and prints each result as it finishes
+
+    Parameters:
+        groups: list of strings naming groups in CASES to run, or None to
+            run every group
+
+    Returns:
+        dict mapping each benchmark name to its cost
+    """
+    results = {}
+    cases = [[(CALIBRATION, _run_calibration())]]
+    cases.extend(CASES[group]() for group in groups or CASES)
+    for group_cases in cases:
+        for name, cost in group_cases:
+            results[name] = cost
+            print(f"{name:<48} {_format_cost(name, cost)}", flush=True)
+    return results
+
+
+def _format_cost(name, cost):
+    """
+    Formats the cost of a benchmark with its unit
+
+    Parameters:
+        name: String of the name of the benchmark
+        cost: float of the cost of the benchmark
+
+    Returns:
+        String of the cost
+    """
+    if "bytes" in name:
+        return f"{cost:12.1f} bytes"
+    return f"{cost * 1e6:12.2f} us"
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Finds the benchmarks that are slower than their baseline
+
+    Benchmarks missing from either set of results are ignored. When both
+    sets include the calibration result, every baseline time is first
+    scaled by how much slower or faster the calibration ran, so a busy or
+    throttled machine is not mistaken for a regression. Memory results are
+    compared as they are.
+
+    Parameters:
+        results: dict mapping each benchmark name to its cost
+        baseline: dict mapping each benchmark name to its baseline cost
+        threshold: float of the slowdown allowed, as a fraction of the
+            baseline
+
+    Returns:
+        list of tuples of the name, cost, baseline cost and ratio of each
+        benchmark that regressed
+    """
+    scale = 1.0
+    if results.get(CALIBRATION) and baseline.get(CALIBRATION):
+        scale = results[CALIBRATION] / baseline[CALIBRATION]
+
+    regressions = []
+    for name, cost in results.items():
+        base = baseline.get(name)
+        if name == CALIBRATION or not base:
+            continue
+        if "bytes" not in name:
+            base *= scale
+        if cost > base * (1 + threshold):
+            regressions.append((name, cost, base, cost / base))
+    return regressions
+
+
+def main(argv=None):
+    """
+    Runs the benchmarks from the command line
+
+    Parameters:
+        argv: list of strings of command line arguments, or None to use
+            sys.argv
+
+    Returns:
+        int: exit status, 1 if a benchmark regressed
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--group",
+        action="append",
+        choices=list(CASES),
+        help="group of benchmarks to run (default: all)",
+    )
+    parser.add_argument("--save", help="file to save the results to")
+    parser.add_argument("--compare", help="baseline file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown as a fraction (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.group)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        for name, cost, base, ratio in regressions:
+            print(
+                f"REGRESSION {name}: {_format_cost(name, cost).strip()} vs "
+                f"{_format_cost(name, base).strip()} ({ratio:.2f}x)"
+            )
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
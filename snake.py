@@ -2,29 +2,45 @@
 Class to represent and control a snake for the game snake
 """
 
+from array import array
+
+# Directions a snake can face, indexed by their integer code. Opposite
+# directions differ only in the lowest bit, so code ^ 1 turns a snake around.
+DIRECTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+
+# Maps both direction names and integer codes to integer codes
+DIRECTION_CODES = {name: code for code, name in enumerate(DIRECTIONS)}
+DIRECTION_CODES.update({code: code for code in range(len(DIRECTIONS))})
+
+# Row and col step of one move in each direction, indexed by code
+ROW_STEPS = (-1, 1, 0, 0)
+COL_STEPS = (0, 0, -1, 1)
+
 
 class Snake:
     """
     Class to represent a snake
 
+    The body is stored head first in a ring buffer made of two int arrays for
+    the rows and cols and a byte array of direction codes, about nine bytes a
+    segment. Moving writes a new head over the slot before the current head
+    and growing writes a new tail after the current tail, so both are
+    constant time (growing is amortized, as the buffer doubles when full).
+
     Attributes:
         locations: Location of all snake segments as a list of lists of ints
         directions: Direction of all snake segments as a list of strings
         apples_eaten: Number of apples eaten as an integer
     """
 
-    _directions_dict = {
-        "UP": [-1, 0],
-        "DOWN": [1, 0],
-        "RIGHT": [0, 1],
-        "LEFT": [0, -1],
-    }
-    _backwards_direction_dict = {
-        "UP": "DOWN",
-        "DOWN": "UP",
-        "RIGHT": "LEFT",
-        "LEFT": "RIGHT",
-    }
+    __slots__ = (
+        "_rows",
+        "_cols",
+        "_codes",
+        "_start",
+        "_length",
+        "_apples_eaten",
+    )
 
     def __init__(
         self,
@@ -57,92 +73,132 @@ class Snake:
             locations = locations_and_directions[0]
             directions = locations_and_directions[1]
         if directions is None and locations is None:
-            self._locations = [[head_location[0], head_location[1]]]
-            for i in range(1, length):
-                segment_row = (
-                    self._directions_dict[
-                        self._backwards_direction_dict[direction]
-                    ][0]
-                    + self._locations[i - 1][0]
-                )
-                segment_col = (
-                    self._directions_dict[
-                        self._backwards_direction_dict[direction]
-                    ][1]
-                    + self._locations[i - 1][1]
-                )
-                self._locations.append([segment_row, segment_col])
-
-            self._directions = [direction for _ in range(length)]
+            code = DIRECTION_CODES[direction]
+            row_step = ROW_STEPS[code ^ 1]
+            col_step = COL_STEPS[code ^ 1]
+            self._rows = array(
+                "i", (head_location[0] + i * row_step for i in range(length))
+            )
+            self._cols = array(
+                "i", (head_location[1] + i * col_step for i in range(length))
+            )
+            self._codes = bytearray([code]) * length
 
         else:
-            self._locations = []
-            self._directions = []
-            for loc in locations:
-                self._locations.append(loc)
-            for direct in directions:
-                self._directions.append(direct)
+            self._rows = array("i", (location[0] for location in locations))
+            self._cols = array("i", (location[1] for location in locations))
+            self._codes = bytearray(
+                DIRECTION_CODES[direct] for direct in directions
+            )
+        self._start = 0
+        self._length = len(self._rows)
 
     def move(self, direction):
         """
         Advance the snake in the indicated direction
 
         Attributes:
-            direction: String which direction for head to move in
+            direction: String (or integer code) of direction for head to move
         """
-
-        if self._backwards_direction_dict[direction] == self._directions[0]:
-            direction = self._directions[0]
-
-        next_head_row = (
-            self._locations[0][0] + self._directions_dict[direction][0]
-        )
-        next_head_col = (
-            self._locations[0][1] + self._directions_dict[direction][1]
-        )
-        self._locations.insert(0, [next_head_row, next_head_col])
-        self._locations.pop()
-        self._directions.insert(0, direction)
-        self._directions.pop()
+        code = DIRECTION_CODES[direction]
+        rows, cols, codes = self._rows, self._cols, self._codes
+        head = self._start
+        if code ^ 1 == codes[head]:
+            code = codes[head]
+
+        # The slot before the head is either spare or holds the old tail
+        new_head = head - 1 if head else len(rows) - 1
+        rows[new_head] = rows[head] + ROW_STEPS[code]
+        cols[new_head] = cols[head] + COL_STEPS[code]
+        codes[new_head] = code
+        self._start = new_head
 
     def grow(self):
         """
         Grow the snake by 1 length
         """
-        backwards_dict = {
-            "UP": "DOWN",
-            "DOWN": "UP",
-            "RIGHT": "LEFT",
-            "LEFT": "RIGHT",
-        }
-
-        tail_direction = self._directions[-1]
-        new_row = (
-            self._locations[-1][0]
-            + self._directions_dict[backwards_dict[tail_direction]][0]
-        )
-        new_col = (
-            self._locations[-1][1]
-            + self._directions_dict[backwards_dict[tail_direction]][1]
-        )
-
-        self._locations.append([new_row, new_col])
-        self._directions.append(tail_direction)
+        capacity = len(self._rows)
+        if self._length == capacity:
+            self._unwrap()
+            self._rows.extend(self._rows)
+            self._cols.extend(self._cols)
+            self._codes.extend(self._codes)
+            capacity *= 2
+
+        tail = (self._start + self._length - 1) % capacity
+        new_tail = (tail + 1) % capacity
+        code = self._codes[tail]
+        self._rows[new_tail] = self._rows[tail] + ROW_STEPS[code ^ 1]
+        self._cols[new_tail] = self._cols[tail] + COL_STEPS[code ^ 1]
+        self._codes[new_tail] = code
+        self._length += 1
         self._apples_eaten += 1
 
+    def _unwrap(self):
+        """
+        Rotates the ring buffer so that the head is in the first slot
+        """
+        start = self._start
+        if start:
+            self._rows = self._rows[start:] + self._rows[:start]
+            self._cols = self._cols[start:] + self._cols[:start]
+            self._codes = self._codes[start:] + self._codes[:start]
+            self._start = 0
+
+    def _slots(self):
+        """
+        Returns the buffer slots of all snake segments from head to tail
+        """
+        capacity = len(self._rows)
+        return [(self._start + i) % capacity for i in range(self._length)]
+
+    def __len__(self):
+        """
+        Returns the number of segments in the snake as an int
+        """
+        return self._length
+
+    @property
+    def head(self):
+        """
+        Returns the location of the head as a list of two ints
+        """
+        return [self._rows[self._start], self._cols[self._start]]
+
+    @property
+    def tail(self):
+        """
+        Returns the location of the last segment as a list of two ints
+        """
+        tail = (self._start + self._length - 1) % len(self._rows)
+        return [self._rows[tail], self._cols[tail]]
+
+    @property
+    def direction(self):
+        """
+        Returns the direction the head is facing as a string
+        """
+        return DIRECTIONS[self._codes[self._start]]
+
     @property
     def directions(self):
         """
-        Returns the directions of all snake segments as a list of lists
+        Returns the directions of all snake segments as a list of strings
+
+        This copies the body, so use head, tail and direction when only the
+        ends of the snake are needed.
         """
-        return self._directions
+        return [DIRECTIONS[self._codes[slot]] for slot in self._slots()]
 
     @property
     def locations(self):
         """
-        Returns the locations of all snake segments as a list of strings
+        Returns the locations of all snake segments as a list of lists
+
+        This copies the body, so use head, tail and direction when only the
+        ends of the snake are needed.
         """
-        return self._locations
+        return [[self._rows[slot], self._cols[slot]] for slot in self._slots()]
 
     @property
     def apples_eaten(self):
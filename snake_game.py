@@ -2,28 +2,157 @@
 Running the snake game
 """
 
-from snake_game_model import SnakeGameModel
-from snake_game_view import GraphicalView
-from snake_game_controller import GraphicalController
+import argparse
+import time
+from snake_game_model import TICK_RATE, SnakeGameModel
+from snake_game_bot_controller import BotController
+from snake_game_replay import Replay
+from snake_game_graphical_view import GraphicalView
+from snake_game_graphical_controller import GraphicalController
 
+# Frames drawn per second at most, independent of the tick rate
+FRAME_RATE = 120
 
-def main():
+# Most ticks to play in one frame to catch up after a slow frame, so a long
+# stall skips time instead of fast forwarding through it
+MAX_TICKS_PER_FRAME = 5
+
+# Most milliseconds to sleep waiting for input on the start and end screens
+# before checking the game again
+IDLE_TIMEOUT = 1000
+
+
+def main(argv=None):
     """
-    Play a game of snake
+    Play a game of snake in a resizable window
+
+    Run `python snake_game.py --help` for the options, such as the window
+    and board sizes and --record FILE to record every match.
+
+    Parameters:
+        argv: list of strings of command line arguments, or None to use
+            sys.argv
     """
+    parser = argparse.ArgumentParser(description="Play Cobra Clash")
+    parser.add_argument(
+        "--record", help="file to record the frames of every match to"
+    )
+    parser.add_argument("--width", type=int, default=1400)
+    parser.add_argument("--height", type=int, default=1050)
+    parser.add_argument("--board-width", type=int, default=19)
+    parser.add_argument("--board-height", type=int, default=19)
+    parser.add_argument(
+        "--bot",
+        type=int,
+        choices=[1, 2],
+        action="append",
+        help="let a bot drive this player's snake, to play alone",
+    )
+    parser.add_argument(
+        "--save-replay",
+        help="file to save the seed and moves of the last match to",
+    )
+    parser.add_argument(
+        "--frame-polling",
+        action="store_true",
+        help="read input once per frame instead of as it arrives",
+    )
+    args = parser.parse_args(argv)
 
-    game = SnakeGameModel()
-    graphics = GraphicalView(game, 1400, 1050)
-    controller = GraphicalController(game)
+    recorder = None
+    if args.record:
+        # Imported here so playing without recording does not need it
+        # pylint: disable=import-outside-toplevel
+        from snake_game_recorder import FrameRecorder
+
+        recorder = FrameRecorder(args.record)
+
+    game = SnakeGameModel(
+        board_width=args.board_width, board_height=args.board_height
+    )
+    graphics = GraphicalView(game, args.width, args.height, recorder)
+    bot = None
+    if args.bot:
+        bot = BotController(game, [player - 1 for player in set(args.bot)])
+    controller = GraphicalController(game, bot)
+    try:
+        play(
+            game,
+            graphics,
+            controller,
+            sample_input=not args.frame_polling,
+            replay_path=args.save_replay,
+        )
+    finally:
+        if recorder is not None:
+            recorder.close()
+            stats = recorder.stats()
+            print(
+                f"Recorded {stats['written']} frames, dropped "
+                f"{stats['dropped']}, encoding "
+                f"{stats['frames_per_second']:.1f} frames per second"
+            )
+
+
+def play(game, graphics, controller, sample_input=True, replay_path=None):
+    """
+    Runs the game loop until the window is closed
+
+    The game ticks at a fixed rate however fast frames are drawn. Time since
+    the last frame is added to an accumulator and one tick is played for
+    every tick length it holds, then the frame is drawn with the snakes part
+    way through their next move by the fraction of a tick left over.
+
+    The start and end screens only change on input, so once drawn the loop
+    sleeps until an event arrives instead of drawing frames.
+
+    While a game runs, input is sampled as it arrives: the time between
+    frames is spent waiting on the event queue rather than sleeping, so a
+    key press is seen within a millisecond instead of at the next frame.
+
+    Parameters:
+        game: An instance of the SnakeGameModel class
+        graphics: An instance of the SnakeGameView class
+        controller: An instance of the GraphicalController class
+        sample_input: A bool of whether to read input as it arrives between
+            frames, or only once at the start of each frame
+        replay_path: A string of the path to save each match to as a
+            replay when it ends, replacing the last, or None
+    """
+    tick_length = 1 / TICK_RATE
+    frame_length = 1 / FRAME_RATE
+    accumulator = 0.0
+    previous_time = time.perf_counter()
 
     while True:
+        now = time.perf_counter()
+        accumulator += now - previous_time
+        previous_time = now
+
         controller.fetch_events()  # Update events at the start of each frame
         if game.game_state == 2:
-            controller.move()
-            if True in game.snake_won():
-                game.set_game_state(3)
-
-        graphics.draw(7)
+            ticks = 0
+            while accumulator >= tick_length and ticks < MAX_TICKS_PER_FRAME:
+                controller.move()
+                accumulator -= tick_length
+                ticks += 1
+                if True in game.snake_won():
+                    game.set_game_state(3)
+                    if replay_path is not None:
+                        Replay.from_model(game).save(replay_path)
+                    break
+            accumulator = min(accumulator, tick_length)
+            if sample_input:
+                graphics.draw(0, accumulator / tick_length)
+                controller.sample_events(now + frame_length)
+            else:
+                graphics.draw(FRAME_RATE, accumulator / tick_length)
+        else:
+            graphics.draw(FRAME_RATE)
+            controller.wait_for_events(IDLE_TIMEOUT)
+            # Start the next game on a fresh tick, not counting time idle
+            accumulator = 0.0
+            previous_time = time.perf_counter()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,152 @@
+"""
+Class to load the images and fonts of the game once and keep them in memory
+"""
+
+import pygame
+
+# Images used by the game, by name
+IMAGE_FILES = {
+    "apple": "images/apple.png",
+    "background": "images/background.png",
+    "snake_head_one": "images/snake_head_one.png",
+    "snake_head_two": "images/snake_head_two.png",
+    "snake_map": "images/snake_map.jpeg",
+    "snake_one_wins": "images/snake_one_wins.png",
+    "snake_two_wins": "images/snake_two_wins.png",
+    "start_screen": "images/start_screen.png",
+    "tie": "images/tie.jpeg",
+}
+
+# Font used for the scores
+SCORE_FONT = "fonts/beech.ttf"
+
+
+class AssetCache:
+    """
+    A class that loads every image of the game once and serves it from
+    memory
+
+    Images are converted to the pixel format of the display when there is
+    one, so blitting them does not convert them again every frame. Images
+    with transparency keep their alpha channel.
+
+    Attributes:
+        _images: A dictionary mapping image names to surfaces
+        _fonts: A dictionary mapping font paths and sizes to fonts
+        _texts: A dictionary mapping the font, text and color of rendered
+            text to its surface
+        _scaled: A dictionary mapping image names and sizes to scaled
+            surfaces
+    """
+
+    def __init__(self, image_files=None):
+        """
+        Loads and converts every image
+
+        pygame must be initialized, and the display mode set for the images
+        to be converted, before the cache is made.
+
+        Parameters:
+            image_files: A dictionary mapping image names to paths, or None
+                to use IMAGE_FILES
+        """
+        self._images = {}
+        self._fonts = {}
+        self._texts = {}
+        self._scaled = {}
+        for name, path in (image_files or IMAGE_FILES).items():
+            self._images[name] = self._load_image(path)
+
+    @staticmethod
+    def _load_image(path):
+        """
+        Loads an image, converted to the display format if there is one
+
+        Parameters:
+            path: A string of the path of the image file
+
+        Returns:
+            A surface of the image
+        """
+        image = pygame.image.load(path)
+        if pygame.display.get_surface() is None:
+            return image
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        return image.convert()
+
+    def image(self, name):
+        """
+        Gets a loaded image
+
+        Parameters:
+            name: A string of the name of the image
+
+        Returns:
+            A surface of the image
+        """
+        return self._images[name]
+
+    def scaled(self, name, size):
+        """
+        Gets a loaded image scaled to a size, scaling it the first time that
+        size is asked for
+
+        Parameters:
+            name: A string of the name of the image
+            size: A tuple of two integers of the width and height to scale to
+
+        Returns:
+            A surface of the scaled image
+        """
+        key = (name, size)
+        if key not in self._scaled:
+            image = self._images[name]
+            if image.get_size() != size:
+                image = pygame.transform.smoothscale(image, size)
+            self._scaled[key] = image
+        return self._scaled[key]
+
+    def clear_scaled(self):
+        """
+        Forgets every scaled image, such as when the window changes size
+        """
+        self._scaled = {}
+
+    def font(self, path, size):
+        """
+        Gets a font, loading it the first time it is asked for
+
+        Parameters:
+            path: A string of the path of the font file
+            size: An integer of the size of the font
+
+        Returns:
+            A pygame font
+        """
+        key = (path, size)
+        if key not in self._fonts:
+            self._fonts[key] = pygame.font.Font(path, size)
+        return self._fonts[key]
+
+    def text(self, path, size, text, color):
+        """
+        Gets antialiased text, rendering it the first time it is asked for
+
+        Text on the screen changes rarely, such as a score when a snake eats,
+        so rendering each distinct text once saves rendering it every frame.
+
+        Parameters:
+            path: A string of the path of the font file
+            size: An integer of the size of the font
+            text: A string of the text to render
+            color: A tuple of three integers for the red, green and blue of
+                the text
+
+        Returns:
+            A surface of the rendered text
+        """
+        key = (path, size, text, color)
+        if key not in self._texts:
+            self._texts[key] = self.font(path, size).render(text, True, color)
+        return self._texts[key]
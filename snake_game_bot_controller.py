@@ -0,0 +1,349 @@
+"""
+Controller class to play snake game with bots that find their way to the
+apples, for load testing and playing alone
+
+The search only needs the model, so this module does not import pygame.
+"""
+
+import heapq
+import time
+from snake import COL_STEPS, DIRECTIONS, ROW_STEPS
+from snake_game_controller import SnakeGameController
+
+# Seconds a bot may spend searching for each move, leaving room under a
+# millisecond for setting up the search and moving
+TIME_BUDGET = 0.0008
+
+# Cells expanded between checks of the clock
+_CHECK_INTERVAL = 16
+
+# Row and col step of one move in each direction, in the order of DIRECTIONS
+_STEPS = tuple(zip(ROW_STEPS, COL_STEPS))
+
+
+def contested_cells(model, index):
+    """
+    Finds the cells the heads of the other snakes could move to next tick
+
+    Parameters:
+        model: An instance of the SnakeGameModel class
+        index: Integer representing which snake to leave out
+
+    Returns:
+        set of tuples of the row and col of each cell
+    """
+    contested = set()
+    for other, snake in enumerate(model.snakes):
+        if other != index:
+            row, col = snake.head
+            contested.update(
+                (row + row_step, col + col_step)
+                for row_step, col_step in _STEPS
+            )
+    return contested
+
+
+def _start_moves(model, index, blocked):
+    """
+    Finds the moves a snake can make onto a free cell, leaving out cells
+    another head could move to next tick unless every move is contested
+
+    Parameters:
+        model: An instance of the SnakeGameModel class
+        index: Integer representing which snake to move
+        blocked: bytearray with a nonzero byte for each cell a snake is on
+
+    Returns:
+        list of tuples of the code of each move and the row major index of
+        the cell it moves onto
+    """
+    contested = contested_cells(model, index)
+    width = model.board_width
+    head_row, head_col = model.snakes[index].head
+    starts = []
+    for move, (row_step, col_step) in enumerate(_STEPS):
+        row, col = head_row + row_step, head_col + col_step
+        if (
+            0 <= row < model.board_height
+            and 0 <= col < width
+            and not blocked[row * width + col]
+        ):
+            starts.append(((row, col) in contested, move, row * width + col))
+    safe_starts = [start for start in starts if not start[0]]
+    return [(move, cell) for _, move, cell in safe_starts or starts]
+
+
+def _nearest_apple(model, location):
+    """
+    Finds the apple closest to a cell, ignoring anything in the way
+
+    Parameters:
+        model: An instance of the SnakeGameModel class
+        location: list of two integers for row and col of the cell
+
+    Returns:
+        tuple of two integers for row and col of the apple, or of the cell
+        when there are no apples
+    """
+    row, col = location
+    return tuple(
+        min(
+            model.apples,
+            key=lambda apple: abs(apple[0] - row) + abs(apple[1] - col),
+            default=location,
+        )
+    )
+
+
+class _Search:
+    """
+    An A* search for a path from a snake's head to an apple, over the cells
+    no snake is on, keeping a tally of what it found beyond each first move
+
+    Attributes:
+        _width: An integer of the width of the board
+        _height: An integer of the height of the board
+        _blocked: A bytearray with a nonzero byte for each cell already
+            searched or with a snake on it
+        _target: A tuple of the row and col of the apple the search is
+            guided toward
+        _queue: A heap of tuples of the estimated length of the path through
+            a cell, the estimated distance left, the moves to the cell and
+            the row major index of the cell
+        _first_moves: A dictionary mapping each cell queued to the code of
+            the first move of the path to it
+        _tallies: A list with, for each move, a list of the cells searched
+            beyond it, to measure its room, the cells queued beyond it and
+            the distance from the target of the closest cell searched
+    """
+
+    def __init__(self, model, target, blocked):
+        """
+        Initializes an instance of the _Search class
+
+        Parameters:
+            model: An instance of the SnakeGameModel class
+            target: A tuple of the row and col of the apple to guide the
+                search toward
+            blocked: A bytearray with a nonzero byte for each cell a snake
+                is on, marked by the search as it goes
+        """
+        self._width = model.board_width
+        self._height = model.board_height
+        self._blocked = blocked
+        self._target = target
+        self._queue = []
+        self._first_moves = {}
+        self._tallies = [[0, 0, float("inf")] for _ in DIRECTIONS]
+
+    def push(self, cell, move, cost):
+        """
+        Queues a cell to be searched
+
+        Parameters:
+            cell: Integer representing the row major index of the cell
+            move: Integer representing the code of the first move of the
+                path to the cell
+            cost: Integer representing the moves it takes to reach the cell
+        """
+        row, col = divmod(cell, self._width)
+        # Never more than the moves it takes to reach the target
+        estimate = abs(row - self._target[0]) + abs(col - self._target[1])
+        self._blocked[cell] = 1
+        self._first_moves[cell] = move
+        self._tallies[move][1] += 1
+        heapq.heappush(self._queue, (cost + estimate, estimate, cost, cell))
+
+    def _neighbours(self, cell):
+        """
+        Gets the cells next to a cell that have not been searched and have
+        no snake on them
+
+        Parameters:
+            cell: Integer representing the row major index of the cell
+
+        Yields:
+            Integer representing the row major index of each free neighbour
+        """
+        row, col = divmod(cell, self._width)
+        for row_step, col_step in _STEPS:
+            next_row, next_col = row + row_step, col + col_step
+            if 0 <= next_row < self._height and 0 <= next_col < self._width:
+                next_cell = next_row * self._width + next_col
+                if not self._blocked[next_cell]:
+                    yield next_cell
+
+    def run(self, apple_cells, deadline, moves, length):
+        """
+        Searches until it reaches an apple, runs out of time or runs out of
+        cells
+
+        Parameters:
+            apple_cells: set of the row major index of each apple
+            deadline: Float of the time.perf_counter time to stop at
+            moves: list of the codes of the first moves queued
+            length: Integer representing the length of the snake
+
+        Returns:
+            Integer representing the code of the move to make
+        """
+        expanded = 0
+        while self._queue:
+            _, estimate, cost, cell = heapq.heappop(self._queue)
+            move = self._first_moves[cell]
+            if cell in apple_cells:
+                return move
+            tally = self._tallies[move]
+            tally[0] += 1
+            tally[1] -= 1
+            tally[2] = min(tally[2], estimate)
+
+            expanded += 1
+            if (
+                expanded % _CHECK_INTERVAL == 0
+                and time.perf_counter() > deadline
+            ):
+                return self._closest_move(moves, length)
+
+            for next_cell in self._neighbours(cell):
+                self.push(next_cell, move, cost + 1)
+
+        # Every reachable cell was searched and no apple was among them
+        return max(moves, key=lambda move: self._tallies[move][0])
+
+    def _closest_move(self, moves, length):
+        """
+        Chooses the move toward the searched cell closest to the target,
+        skipping moves into dead ends too small for the snake
+
+        Parameters:
+            moves: list of the codes of the first moves queued
+            length: Integer representing the length of the snake
+
+        Returns:
+            Integer representing the code of the move to make
+        """
+        tallies = self._tallies
+        roomy = [
+            move
+            for move in moves
+            if tallies[move][1] or tallies[move][0] >= length
+        ]
+        return min(roomy or moves, key=lambda move: tallies[move][2])
+
+
+def find_move(model, index, time_budget=TIME_BUDGET):
+    """
+    Finds the direction that takes a snake toward the nearest apple
+
+    An A* search runs from the snake's head over the cells no snake is on
+    until it reaches an apple, guided toward the apple nearest the head and
+    avoiding the cells another head could move to next tick where it can.
+    Guiding the search by one apple keeps each step constant time however
+    many apples there are. The search is anytime: when the time budget runs
+    out it moves toward the searched cell closest to that apple, avoiding
+    dead ends found too small for the snake. If no apple can be reached it
+    moves toward the most room.
+
+    Parameters:
+        model: An instance of the SnakeGameModel class
+        index: Integer representing which snake to move
+        time_budget: Float of the most seconds to search for
+
+    Returns:
+        String of direction for the snake to move in
+    """
+    deadline = time.perf_counter() + time_budget
+    snake = model.snakes[index]
+    blocked = bytearray(model.occupancy)
+    starts = _start_moves(model, index, blocked)
+    if not starts:
+        return snake.direction
+
+    search = _Search(model, _nearest_apple(model, snake.head), blocked)
+    for move, cell in starts:
+        search.push(cell, move, 1)
+    width = model.board_width
+    apple_cells = {row * width + col for row, col in model.apples}
+    moves = [move for move, _ in starts]
+    return DIRECTIONS[search.run(apple_cells, deadline, moves, len(snake))]
+
+
+class BotController(SnakeGameController):
+    """
+    A class inheriting from the SnakeGameController class to move snakes
+    with find_move, each within a time budget
+
+    Snakes the bots do not drive keep going the way they are facing, unless
+    another controller moves them using directions.
+
+    Attributes:
+        _players: A tuple of the indexes of the snakes the bots drive
+        _time_budget: A float of the most seconds to search for each move
+        _moves: An integer of the moves chosen
+        _total_time: A float of the seconds spent choosing moves
+        _max_time: A float of the most seconds spent choosing one move
+    """
+
+    def __init__(self, model, players=None, time_budget=TIME_BUDGET):
+        """
+        Initializes an instance of the BotController class
+
+        Parameters:
+            model: An instance of the SnakeGameModel class
+            players: An iterable of the indexes of the snakes to drive, or
+                None to drive every snake
+            time_budget: A float of the most seconds to search for each move
+        """
+        super().__init__(model)
+        if players is None:
+            players = range(model.num_snakes)
+        self._players = tuple(players)
+        self._time_budget = time_budget
+        self._moves = 0
+        self._total_time = 0.0
+        self._max_time = 0.0
+
+    def directions(self):
+        """
+        Chooses the next move of each snake the bots drive
+
+        Returns:
+            dict mapping the index of each snake the bots drive to the
+            direction it should move in
+        """
+        directions = {}
+        for player in self._players:
+            start = time.perf_counter()
+            directions[player] = find_move(
+                self._model, player, self._time_budget
+            )
+            elapsed = time.perf_counter() - start
+            self._moves += 1
+            self._total_time += elapsed
+            self._max_time = max(self._max_time, elapsed)
+        return directions
+
+    def move(self):
+        """
+        Moves the snakes the bots drive, and every other snake on in the
+        same direction
+        """
+        directions = [snake.direction for snake in self._model.snakes]
+        for player, direction in self.directions().items():
+            directions[player] = direction
+        self._model.move_snakes(*directions)
+
+    def move_stats(self):
+        """
+        Gets how long the bots took to choose their moves
+
+        Returns:
+            dict with the number of moves chosen and the mean and max
+            seconds spent choosing one
+        """
+        return {
+            "moves": self._moves,
+            "mean_time": self._total_time / self._moves if self._moves else 0.0,
+            "max_time": self._max_time,
+        }
@@ -0,0 +1,95 @@
+"""
+Class to draw the game as one pixel per board cell, for fast observations
+by pixel based bots
+
+It only needs NumPy, not pygame.
+"""
+
+import numpy as np
+from snake_game_view import SnakeGameView
+
+# Color of empty cells and apples in a CellView frame
+EMPTY_COLOR = (0, 0, 0)
+APPLE_COLOR = (255, 255, 0)
+
+# Body and head colors of each snake in a CellView frame, repeating for more
+# snakes. The first two match the snake bodies of GraphicalView
+SNAKE_COLORS = [
+    ((0, 255, 0), (0, 128, 0)),
+    ((255, 0, 0), (128, 0, 0)),
+    ((0, 0, 255), (0, 0, 128)),
+    ((255, 0, 255), (128, 0, 128)),
+]
+
+
+class CellView(SnakeGameView):
+    """
+    A class inheriting from the SnakeGameView class to draw the game as one
+    pixel per board cell, for fast observations
+
+    Cells are colored by EMPTY_COLOR, APPLE_COLOR and SNAKE_COLORS. Later
+    snakes are drawn over earlier ones and apples over snakes, as in
+    GraphicalView.
+
+    Attributes:
+        _frame: A NumPy array of uint8 indexed by [row, col, channel] with
+            the color of each cell
+        _snake_colors: A NumPy array of uint8 indexed by [snake, part,
+            channel] with the body (part 0) and head (part 1) colors
+    """
+
+    def __init__(self, model):
+        """
+        Initializes an instance of the CellView class
+
+        Parameters:
+            model: An instance of the SnakeGameModel class
+        """
+        super().__init__(model)
+        self._frame = np.zeros(
+            (model.board_height, model.board_width, 3), dtype=np.uint8
+        )
+        self._snake_colors = np.array(
+            [
+                SNAKE_COLORS[index % len(SNAKE_COLORS)]
+                for index in range(model.num_snakes)
+            ],
+            dtype=np.uint8,
+        )
+
+    def draw(self, frame_rate=0, interpolation=None):
+        """
+        Draws the current state of the game into the frame
+
+        Parameters:
+            frame_rate: Ignored, as frames are drawn as fast as asked for
+            interpolation: Ignored, as snakes are always drawn in their cells
+        """
+        del frame_rate, interpolation
+        frame = self._frame
+        frame[:] = EMPTY_COLOR
+        height, width = frame.shape[:2]
+
+        for index, snake in enumerate(self._model.snakes):
+            rows, cols = np.array(snake.locations).T
+            on_board = (rows >= 0) & (rows < height) & (cols >= 0)
+            on_board &= cols < width
+            frame[rows[on_board], cols[on_board]] = self._snake_colors[index, 0]
+            if on_board[0]:
+                frame[rows[0], cols[0]] = self._snake_colors[index, 1]
+
+        for row, col in self._model.apples:
+            frame[row, col] = APPLE_COLOR
+
+    @property
+    def frame(self):
+        """
+        Gets the colors of the cells drawn by the last call to draw
+
+        The same array is reused by every draw, so copy it to keep a frame.
+
+        Returns:
+            A NumPy array of uint8 indexed by [row, col, channel] with the
+            red, green and blue of each cell
+        """
+        return self._frame
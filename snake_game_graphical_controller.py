@@ -0,0 +1,253 @@
+"""Controller class to play snake game with the keyboard using pygame"""
+
+import sys
+import time
+from collections import deque
+import pygame
+from snake import DIRECTIONS
+from snake_game_controller import SnakeGameController
+
+# Most moves a player can have waiting for the next ticks
+MAX_QUEUED_MOVES = 3
+
+# Direction each player's snake starts moving in
+_STARTING_DIRECTIONS = ("RIGHT", "LEFT")
+
+# Events sent when part of the window was uncovered or restored and shows
+# nothing until the screen is put on it again
+_EXPOSE_EVENTS = (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE)
+
+# Maps each direction to its reverse. Reverse directions differ in the
+# lowest bit of their index in DIRECTIONS
+_OPPOSITES = {
+    direction: DIRECTIONS[index ^ 1]
+    for index, direction in enumerate(DIRECTIONS)
+}
+
+
+def _new_input_stats():
+    """
+    Makes the counters of one player's key presses
+
+    Returns:
+        dict of the counts of moves queued, applied, filtered and dropped,
+        and the total and max seconds from key press to move
+    """
+    return {
+        "queued": 0,
+        "applied": 0,
+        "filtered": 0,
+        "dropped": 0,
+        "total_latency": 0.0,
+        "max_latency": 0.0,
+    }
+
+
+class GraphicalController(SnakeGameController):
+    """
+    A class inheriting from the SnakeGameController class to control
+    the snakes according to the inputs
+
+    Each player's key presses wait in a queue of at most MAX_QUEUED_MOVES
+    timestamped moves, and every tick applies the oldest one, so quick turns
+    are kept in order instead of being lost.
+
+    Parameters:
+        SnakeGameController: An instance of the SnakeGameController class
+
+    Attributes:
+        _player_queues: A list with a deque of (direction, time) tuples of
+            the moves waiting for each player
+        _player_directions: A list of the direction each player last moved
+        _input_stats: A list with a dict of counters for each player
+        _bot: An instance of the BotController class moving the snakes of
+            players who are not at the keyboard, or None
+        events: A list of the pygame events fetched this frame
+    """
+
+    _player_one_moves = {
+        pygame.K_w: "UP",
+        pygame.K_s: "DOWN",
+        pygame.K_a: "LEFT",
+        pygame.K_d: "RIGHT",
+    }
+
+    _player_two_moves = {
+        pygame.K_UP: "UP",
+        pygame.K_DOWN: "DOWN",
+        pygame.K_LEFT: "LEFT",
+        pygame.K_RIGHT: "RIGHT",
+    }
+
+    def __init__(self, model, bot=None):
+        """
+        Initializes the GraphicController class
+
+        Parameters:
+            model: An instance of the SnakeGameModel class
+            bot: An instance of the BotController class to move the snakes
+                it drives in place of the keyboard, or None
+        """
+        super().__init__(model)
+        self._bot = bot
+        self._input_stats = [_new_input_stats() for _ in _STARTING_DIRECTIONS]
+        self.reset()
+
+    def reset(self):
+        """
+        Resets the different variables used to move the snakes
+
+        The input statistics are kept, so they cover every game played.
+        """
+        self._player_queues = [
+            deque(maxlen=MAX_QUEUED_MOVES) for _ in _STARTING_DIRECTIONS
+        ]
+        self._player_directions = list(_STARTING_DIRECTIONS)
+        self.events = []
+
+    def _queue_move(self, player, direction, timestamp):
+        """
+        Adds a move to a player's queue, unless it would do nothing
+
+        A move the same as, or the reverse of, the move before it is
+        filtered out, as the snake would ignore it and waste a tick. A move
+        that does not fit in the queue is dropped.
+
+        Parameters:
+            player: An integer representing the index of the player
+            direction: A string of the direction to move in
+            timestamp: A float of the time.perf_counter time of the key press
+        """
+        queue = self._player_queues[player]
+        stats = self._input_stats[player]
+        if queue:
+            last_direction = queue[-1][0]
+        else:
+            last_direction = self._player_directions[player]
+        if direction in (last_direction, _OPPOSITES[last_direction]):
+            stats["filtered"] += 1
+        elif len(queue) == queue.maxlen:
+            stats["dropped"] += 1
+        else:
+            queue.append((direction, timestamp))
+            stats["queued"] += 1
+
+    def fetch_events(self):
+        """Fetch all pygame events and store them internally."""
+        self.events = pygame.event.get()
+        self._process_events()
+
+    def wait_for_events(self, timeout):
+        """
+        Waits until there are pygame events, then fetches and processes them
+
+        While waiting the process sleeps, so a screen that only changes on
+        input uses no CPU.
+
+        Parameters:
+            timeout: An integer of the most milliseconds to wait
+        """
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            self.events = []
+        else:
+            self.events = [event] + pygame.event.get()
+        self._process_events()
+
+    def sample_events(self, deadline):
+        """
+        Processes pygame events as they arrive until a deadline
+
+        Waiting for events in place of sleeping between frames timestamps
+        each key press when it happens, instead of at the next frame.
+
+        Parameters:
+            deadline: A float of the time.perf_counter time to stop at
+        """
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return
+            self.wait_for_events(max(1, round(remaining * 1000)))
+
+    def _process_events(self):
+        """
+        Process the stored events to update game state accordingly
+
+        The view only redraws what changed, and nothing on the start and end
+        screens, so an exposed window is repainted here from the screen
+        surface, which always holds the last frame drawn.
+        """
+        now = time.perf_counter()
+        for event in self.events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            elif event.type in _EXPOSE_EVENTS:
+                pygame.display.update()
+            elif event.type == pygame.KEYDOWN:
+                if self._model.game_state == 1:
+                    if event.key == pygame.K_SPACE:
+                        self._model.set_game_state(2)
+                elif self._model.game_state == 2:
+                    if event.key in self._player_one_moves:
+                        self._queue_move(
+                            0, self._player_one_moves[event.key], now
+                        )
+                    elif event.key in self._player_two_moves:
+                        self._queue_move(
+                            1, self._player_two_moves[event.key], now
+                        )
+                else:
+                    if event.key == pygame.K_SPACE:
+                        self._model.reset()
+                        self.reset()
+                        self._model.set_game_state(2)
+
+    def move(self):
+        """
+        Moves each snake by the oldest move in its player's queue, or on in
+        the same direction if the queue is empty, unless a bot drives it
+        """
+        now = time.perf_counter()
+        for player, queue in enumerate(self._player_queues):
+            if queue:
+                direction, timestamp = queue.popleft()
+                self._player_directions[player] = direction
+                stats = self._input_stats[player]
+                latency = now - timestamp
+                stats["applied"] += 1
+                stats["total_latency"] += latency
+                stats["max_latency"] = max(stats["max_latency"], latency)
+
+        directions = self._player_directions
+        if self._bot is not None:
+            directions = list(directions)
+            for player, direction in self._bot.directions().items():
+                directions[player] = direction
+        self._model.move_snakes(*directions)
+
+    def input_stats(self):
+        """
+        Gets statistics of each player's key presses, for tuning input
+
+        Returns:
+            list with a dict for each player of the moves queued, applied,
+            filtered as repeats or reversals and dropped from a full queue,
+            and the mean and max seconds from a key press to its move
+        """
+        return [
+            {
+                "queued": stats["queued"],
+                "applied": stats["applied"],
+                "filtered": stats["filtered"],
+                "dropped": stats["dropped"],
+                "mean_latency": (
+                    stats["total_latency"] / stats["applied"]
+                    if stats["applied"]
+                    else 0.0
+                ),
+                "max_latency": stats["max_latency"],
+            }
+            for stats in self._input_stats
+        ]
@@ -0,0 +1,635 @@
+"""
+Contains the viewer class to view the game graphically
+"""
+
+import pygame
+from snake_game_assets import SCORE_FONT, AssetCache
+from snake_game_view import SnakeGameView
+
+# Color of the score of each player
+_SCORE_COLORS = ((0, 255, 0), (255, 0, 0))
+
+# Cells of room kept beside the board for each player's score, enough for a
+# two digit score in the font twice as tall as a cell
+_SCORE_CELLS = 3
+
+
+class GraphicalView(SnakeGameView):
+    """
+    A class inheriting from the SnakeGameView class to display the game
+    graphically using pygame
+
+    Attributes:
+        _width: An integer the width of the game window
+        _height: An integer representing the height of the game window
+        _model: An instance of the SnakeGameMode class
+        _screen: A surface representing the game window surface
+            created using pygame
+        _cell_size: An integer representing the width and height of a
+            board cell in pixels
+        _shift: A float representing the shift value to center
+            the game board horizontally
+        _top: A float representing the shift value to center the game
+            board vertically
+        _in_bounds_shift: An integer representing the shift value to
+            properly place assets on the board, the width of the wall
+        _assets: An instance of the AssetCache class holding the images
+            and fonts, loaded once
+        _snake_one_body: A surface representing the body of Snake One
+        _snake_two_body: A surface representing the body of Snake Two
+        _snake_one_heads: A dictionary mapping each direction to a surface
+            representing the head of Snake One facing it
+        _snake_two_heads: A dictionary mapping each direction to a surface
+            representing the head of Snake Two facing it
+        _clock: A pygame clock used to keep the frame rate
+        _drawn_state: An integer representing the game state drawn on the
+            last frame, or None before the first frame
+        _drawn_scores: A tuple of the scores drawn on the screen
+        _drawn_cells: A dictionary mapping each (row, col) tuple with
+            sprites drawn on it on the last frame to those sprites, as
+            returned by _cell_sprites
+        _snake_ends: A list with the previous and current head and tail of
+            each drawn snake, as (row, col) tuples, to interpolate moves
+        _ends_tick: An integer of the tick of the model the current heads
+            and tails in _snake_ends are from
+        _motion_cells: A list of lists of two integers for row and col of
+            the cells covered by interpolated sprites on the last frame
+        _score_sprites: A dictionary mapping each player and score drawn to
+            the rendered score and its rect
+        _recorder: An instance of the FrameRecorder class capturing every
+            frame drawn, or None
+    """
+
+    def __init__(self, model, width, height, recorder=None):
+        """
+        Initializes an instance of the GraphicalView class
+
+        Parameters:
+            model: An instance of the SnakeGameModel class
+            width: An integer representing the width of the game window
+            height: An integer representing the height of the game window
+            recorder: An instance of the FrameRecorder class to capture
+                every frame drawn, or None to not record
+        """
+        super().__init__(model)
+        self._recorder = recorder
+
+        # Initializing pygame
+        pygame.init()
+        self._screen = self._make_screen(width, height)
+
+        # Load every asset once instead of every frame
+        self._assets = AssetCache()
+        self._clock = pygame.time.Clock()
+
+        # What is on the screen, so a running game only redraws changes
+        self._drawn_scores = None
+        self._drawn_cells = {}
+        self._snake_ends = []
+        self._ends_tick = 0
+        self._motion_cells = []
+
+        self._layout(width, height)
+
+    def _layout(self, width, height):
+        """
+        Sizes the board to fit the window and scales every sprite to match
+
+        Cells are square and as large as fits the board with its wall, and
+        room for a score on either side, in the window. The board is
+        centered. Sprites are scaled here, once per window size, so drawing
+        never scales.
+
+        Parameters:
+            width: An integer representing the width of the game window
+            height: An integer representing the height of the game window
+        """
+        self._width = width
+        self._height = height
+
+        # To place the assets properly on the board
+        board_width = self._model.board_width + 2
+        board_height = self._model.board_height + 2
+        cell = max(
+            1,
+            min(
+                width // (board_width + 2 * _SCORE_CELLS),
+                height // board_height,
+            ),
+        )
+        self._cell_size = cell
+        self._shift = (width - board_width * cell) / 2
+        self._top = (height - board_height * cell) / 2
+        self._in_bounds_shift = cell
+
+        self._assets.clear_scaled()
+        self._snake_one_body = pygame.Surface((cell, cell), 0, self._screen)
+        self._snake_one_body.fill("Green")
+        self._snake_two_body = pygame.Surface((cell, cell), 0, self._screen)
+        self._snake_two_body.fill("Red")
+
+        # Rotate the heads once, so drawing a head is a single blit
+        self._snake_one_heads = self._snake_head_directions(
+            self._assets.scaled("snake_head_one", (cell, cell))
+        )
+        self._snake_two_heads = self._snake_head_directions(
+            self._assets.scaled("snake_head_two", (cell, cell))
+        )
+
+        # Rendered scores and their rects, by player and score
+        self._score_sprites = {}
+
+        # Redraw everything on the next frame
+        self._drawn_state = None
+
+    def _scaled(self, name, size=None):
+        """
+        Gets an image scaled for the current window size
+
+        Parameters:
+            name: A string of the name of the image
+            size: A tuple of the width and height to scale to, or None for
+                the size of the window
+
+        Returns:
+            A surface of the scaled image
+        """
+        return self._assets.scaled(name, size or (self._width, self._height))
+
+    def _board_image(self):
+        """
+        Gets the map image scaled to cover the board and its wall
+
+        Returns:
+            A surface of the scaled map
+        """
+        return self._scaled(
+            "snake_map",
+            (
+                (self._model.board_width + 2) * self._cell_size,
+                (self._model.board_height + 2) * self._cell_size,
+            ),
+        )
+
+    def _make_screen(self, width, height):
+        """
+        Opens the game window
+
+        Parameters:
+            width: An integer representing the width of the game window
+            height: An integer representing the height of the game window
+
+        Returns:
+            A surface representing the game window
+        """
+        screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        pygame.display.set_caption("Cobra Clash")
+        return screen
+
+    @staticmethod
+    def _snake_head_directions(snake_head):
+        """
+        Rotates the snake's head image to face every direction
+
+        Parameters:
+            snake_head: A surface representing the image of the snake's head,
+                facing down
+
+        Returns:
+            A dictionary mapping each direction string to a surface of the
+            head rotated to face it
+        """
+        return {
+            "UP": pygame.transform.rotate(snake_head, 180),
+            "DOWN": pygame.transform.rotate(snake_head, 0),
+            "RIGHT": pygame.transform.rotate(snake_head, 90),
+            "LEFT": pygame.transform.rotate(snake_head, -90),
+        }
+
+    def _draw_snake(self, snake, snake_body, snake_heads):
+        """
+        Draws the given snake onto the board
+
+        Args:
+            snake: An instance of the snake class
+            snake_body: A surface representing the image of the snake's body
+            snake_heads: A dictionary mapping each direction string to a
+                surface representing the image of the snake's head facing it
+
+        Returns:
+            None
+        """
+
+        direction = snake.direction
+        for index, location in enumerate(snake.locations):
+            # Convert the index for the square in the grade into the
+            # pixel location on the screen
+            x_value = (
+                location[1] * self._cell_size
+                + self._shift
+                + self._in_bounds_shift
+            )
+            y_value = (
+                location[0] * self._cell_size
+                + self._top
+                + self._in_bounds_shift
+            )
+            if index == 0:
+                self._screen.blit(snake_heads[direction], (x_value, y_value))
+                continue
+            self._screen.blit(snake_body, (x_value, y_value))
+
+    def _cell_rect(self, row, col):
+        """
+        Gets the area of the screen covered by a board cell
+
+        Parameters:
+            row: An integer representing the row of the cell
+            col: An integer representing the col of the cell
+
+        Returns:
+            A pygame rect of the cell on the screen
+        """
+        return pygame.Rect(
+            col * self._cell_size + self._shift + self._in_bounds_shift,
+            row * self._cell_size + self._top + self._in_bounds_shift,
+            self._cell_size,
+            self._cell_size,
+        )
+
+    def _draw_scores(self, score_snake_one, score_snake_two):
+        """
+        Draws the scores of each player onto the screen
+
+        Parameters:
+            score_snake_one: An integer representing the apples eaten by
+                snake one
+            score_snake_two: An integer representing the apples eaten by
+                snake two
+
+        Returns:
+            None
+        """
+        for player, score in enumerate((score_snake_one, score_snake_two)):
+            self._screen.blit(*self._score_sprite(player, score))
+
+    def _score_sprite(self, player, score):
+        """
+        Gets the rendered score of a player and where to draw it, rendering
+        it the first time that score is drawn
+
+        Parameters:
+            player: An integer representing the index of the snake
+            score: An integer representing the apples eaten by the snake
+
+        Returns:
+            A surface of the score text
+            A pygame rect of where to draw it on the screen
+        """
+        key = (player, score)
+        if key not in self._score_sprites:
+            # The font is twice as tall as a cell, as at 50 pixel cells
+            text_surface = self._assets.text(
+                SCORE_FONT,
+                2 * self._cell_size,
+                f"{score}",
+                _SCORE_COLORS[player],
+            )
+            text_rect = text_surface.get_rect()
+            if player == 0:
+                text_rect.center = (self._shift / 2, self._height / 2)
+            else:
+                text_rect.center = (
+                    self._width - self._shift / 2,
+                    self._height / 2,
+                )
+            self._score_sprites[key] = (text_surface, text_rect)
+        return self._score_sprites[key]
+
+    def _draw_start_screen(self):
+        """
+        Draws the starting game image on the screen
+        """
+        self._screen.blit(self._scaled("start_screen"), (0, 0))
+
+    def _draw_running_game(self):
+        """
+        Draws all the assets of the game on the screen when it is running
+        """
+        apple_image = self._scaled("apple", (self._cell_size,) * 2)
+
+        self._screen.blit(self._scaled("background"), (0, 0))
+        self._screen.blit(self._board_image(), (self._shift, self._top))
+
+        # Draw the scores of each player
+        self._drawn_scores = (
+            self._model.snake_one.apples_eaten,
+            self._model.snake_two.apples_eaten,
+        )
+        self._draw_scores(*self._drawn_scores)
+
+        # Draw the snakes
+        self._draw_snake(
+            self._model.snake_one,
+            self._snake_one_body,
+            self._snake_one_heads,
+        )
+        self._draw_snake(
+            self._model.snake_two,
+            self._snake_two_body,
+            self._snake_two_heads,
+        )
+
+        # Draw the apple
+        for apple in self._model.apples:
+            self._screen.blit(
+                apple_image,
+                self._cell_rect(*apple),
+            )
+
+        self._drawn_cells = self._cell_sprites()
+
+        # Nothing moved since this frame
+        self._snake_ends = [
+            [tuple(snake.head), tuple(snake.tail)] * 2
+            for snake in self._model.snakes[:2]
+        ]
+        self._ends_tick = self._model.ticks
+        self._motion_cells = []
+
+    def _cell_sprites(self):
+        """
+        Works out which sprites a full redraw draws on each cell
+
+        The snakes are drawn in order, each from head to tail, and then the
+        apples, so later sprites are on top. A body square hides everything
+        under it, so a cell only keeps the sprites from its top body up.
+
+        Returns:
+            A dictionary mapping each (row, col) tuple on the board or its
+            wall with sprites on it to a tuple of those sprites, bottom
+            first. A sprite is ("body", snake index), ("head", snake index,
+            direction) or ("apple",)
+        """
+        cells = {}
+        for index, snake in enumerate(self._model.snakes[:2]):
+            locations = snake.locations
+            head = tuple(locations[0])
+            cells[head] = cells.get(head, ()) + (
+                ("head", index, snake.direction),
+            )
+            for location in locations[1:]:
+                cells[tuple(location)] = (("body", index),)
+        for apple in self._model.apples:
+            cell = tuple(apple)
+            cells[cell] = cells.get(cell, ()) + (("apple",),)
+
+        height = self._model.board_height
+        width = self._model.board_width
+        return {
+            cell: sprites
+            for cell, sprites in cells.items()
+            if -1 <= cell[0] <= height and -1 <= cell[1] <= width
+        }
+
+    def _draw_changed_cells(self):
+        """
+        Redraws only the cells of a running game that changed since the last
+        frame, and the scores if they changed
+
+        The view compares what it drew on the last frame with what the model
+        holds now, so any number of views can draw the same model. Each
+        changed cell is covered with its part of the map, then its sprites
+        are drawn on top, in the same order as a full redraw.
+
+        Returns:
+            A list of pygame rects of the areas of the screen redrawn
+        """
+        dirty_rects = []
+        snake_map = self._board_image()
+        apple_image = self._scaled("apple", (self._cell_size,) * 2)
+        bodies = (self._snake_one_body, self._snake_two_body)
+        heads = (self._snake_one_heads, self._snake_two_heads)
+
+        cells = self._cell_sprites()
+        drawn_cells = self._drawn_cells
+        changed_cells = {
+            cell
+            for cell, sprites in cells.items()
+            if drawn_cells.get(cell) != sprites
+        }
+        changed_cells.update(cell for cell in drawn_cells if cell not in cells)
+        # Cover up the interpolated sprites of the last frame too
+        changed_cells.update(tuple(cell) for cell in self._motion_cells)
+        self._motion_cells = []
+        self._drawn_cells = cells
+
+        for cell in changed_cells:
+            rect = self._cell_rect(*cell)
+            self._screen.blit(
+                snake_map, rect, rect.move(-self._shift, -self._top)
+            )
+            for sprite in cells.get(cell, ()):
+                if sprite[0] == "body":
+                    self._screen.blit(bodies[sprite[1]], rect)
+                elif sprite[0] == "head":
+                    self._screen.blit(heads[sprite[1]][sprite[2]], rect)
+                else:
+                    self._screen.blit(apple_image, rect)
+            dirty_rects.append(rect)
+
+        scores = (
+            self._model.snake_one.apples_eaten,
+            self._model.snake_two.apples_eaten,
+        )
+        if scores != self._drawn_scores:
+            background = self._scaled("background")
+            for rect in (
+                pygame.Rect(0, 0, self._shift, self._height),
+                pygame.Rect(
+                    self._width - self._shift, 0, self._shift, self._height
+                ),
+            ):
+                self._screen.blit(background, rect, rect)
+                dirty_rects.append(rect)
+            self._drawn_scores = scores
+            self._draw_scores(*scores)
+
+        return dirty_rects
+
+    def _draw_end_screen(self):
+        """
+        Draws the end game image on the screen according to which player wins
+        """
+        snake_one_won, snake_two_won = self._model.snake_won()
+        if snake_one_won and snake_two_won:
+            self._screen.blit(self._scaled("tie"), (0, 0))
+        elif snake_one_won:
+            self._screen.blit(self._scaled("snake_one_wins"), (0, 0))
+        elif snake_two_won:
+            self._screen.blit(self._scaled("snake_two_wins"), (0, 0))
+
+    def _lerp_position(self, start, end, fraction):
+        """
+        Gets the pixel position of a sprite part way between two cells
+
+        Parameters:
+            start: A tuple of two integers for row and col of the first cell
+            end: A tuple of two integers for row and col of the second cell
+            fraction: A float from 0 to 1 of the way from start to end
+
+        Returns:
+            A tuple of two floats for the x and y of the sprite on the screen
+        """
+        row = start[0] + (end[0] - start[0]) * fraction
+        col = start[1] + (end[1] - start[1]) * fraction
+        return (
+            col * self._cell_size + self._shift + self._in_bounds_shift,
+            row * self._cell_size + self._top + self._in_bounds_shift,
+        )
+
+    def _draw_motion(self, interpolation):
+        """
+        Draws each snake part way through its last move
+
+        The cell the head moved into is cleared, then the tail is drawn
+        sliding out of the cell it left and the head sliding from its
+        previous cell, so the snakes move smoothly between ticks. Snakes
+        that played more than one tick since the last frame, as when the
+        game catches up after a slow frame, are drawn in their cells.
+
+        Parameters:
+            interpolation: A float from 0 to 1 of the way through the time
+                between the last tick and the next
+
+        Returns:
+            A list of pygame rects of the areas of the screen drawn on
+        """
+        snake_map = self._board_image()
+        bodies = (self._snake_one_body, self._snake_two_body)
+        heads = (self._snake_one_heads, self._snake_two_heads)
+
+        # Notice the snakes that moved one cell since the last frame
+        ticks = self._model.ticks
+        one_tick = ticks == self._ends_tick + 1
+        self._ends_tick = ticks
+        moving = []
+        for index, snake in enumerate(self._model.snakes[:2]):
+            ends = self._snake_ends[index]
+            head = tuple(snake.head)
+            if head != ends[2]:
+                ends[:] = [ends[2], ends[3], head, tuple(snake.tail)]
+                step = abs(head[0] - ends[0][0]) + abs(head[1] - ends[0][1])
+                if not one_tick or step != 1:
+                    # The sprites would cross cells that are not redrawn
+                    ends[:2] = ends[2:]
+            if ends[0] != ends[2]:
+                moving.append(index)
+
+        motion_cells = []
+        for index in moving:
+            prev_head, prev_tail, head, tail = self._snake_ends[index]
+            if self._model.is_safe(prev_tail):
+                motion_cells.append(list(prev_tail))
+            motion_cells.extend([list(prev_head), list(head), list(tail)])
+            rect = self._cell_rect(*head)
+            self._screen.blit(
+                snake_map, rect, rect.move(-self._shift, -self._top)
+            )
+        for index in moving:
+            prev_head, prev_tail, head, tail = self._snake_ends[index]
+            if prev_tail != tail and self._model.is_safe(prev_tail):
+                self._screen.blit(
+                    bodies[index],
+                    self._lerp_position(prev_tail, tail, interpolation),
+                )
+        for index in moving:
+            prev_head, _, head, _ = self._snake_ends[index]
+            direction = self._model.snakes[index].direction
+            self._screen.blit(
+                heads[index][direction],
+                self._lerp_position(prev_head, head, interpolation),
+            )
+
+        height = self._model.board_height
+        width = self._model.board_width
+        self._motion_cells = [
+            cell
+            for cell in motion_cells
+            if 0 <= cell[0] < height and 0 <= cell[1] < width
+        ]
+        return [self._cell_rect(*cell) for cell in self._motion_cells]
+
+    def _render(self, interpolation=None):
+        """
+        Draws the screens and assets according to the state of the game
+
+        A running game only redraws the cells that changed since this view
+        last drew it. The start and end screens do not change, so they are drawn
+        once and then left alone. Everything is redrawn when the game state
+        changes or the window is resized.
+
+        Parameters:
+            interpolation: A float from 0 to 1 of the way through the time
+                between the last tick and the next, to draw the snakes part
+                way through their moves, or None to draw them in their cells
+
+        Returns:
+            A list of pygame rects of the areas of the screen drawn on, empty
+            if nothing was, or None if the whole screen was drawn
+        """
+        game_state = self._model.game_state
+        dirty_rects = None
+        if game_state != 2 and game_state == self._drawn_state:
+            return []
+        if game_state == 2:
+            if game_state != self._drawn_state:
+                self._draw_running_game()
+            else:
+                dirty_rects = self._draw_changed_cells()
+            if interpolation is not None:
+                motion_rects = self._draw_motion(interpolation)
+                if dirty_rects is not None:
+                    dirty_rects.extend(motion_rects)
+        elif game_state == 1:
+            self._draw_start_screen()
+        else:
+            self._draw_end_screen()
+        self._drawn_state = game_state
+
+        if self._recorder is not None:
+            self._recorder.capture(self._screen)
+        return dirty_rects
+
+    def draw(self, frame_rate, interpolation=None):
+        """
+        Combines all the private methods and displays the screens and assets
+        according to the state of the game
+
+        Only the areas of the window that were drawn on are updated, so
+        the window is not touched at all while a start or end screen shows.
+
+        Parameters:
+            frame_rate: An integer representing the frame rate at which the
+                game should run
+            interpolation: A float from 0 to 1 of the way through the time
+                between the last tick and the next, to draw the snakes part
+                way through their moves, or None to draw them in their cells
+
+            Returns:
+                None
+        """
+        # The window surface changes size when the window is resized
+        screen = pygame.display.get_surface()
+        if screen.get_size() != (self._width, self._height):
+            self._screen = screen
+            self._layout(*screen.get_size())
+
+        dirty_rects = self._render(interpolation)
+        if dirty_rects is None:
+            pygame.display.update()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+
+        # Set the frames per second for the game
+        self._clock.tick(frame_rate)
@@ -0,0 +1,223 @@
+"""
+Play games of snake without a window as fast as possible
+
+Run `python snake_game_headless.py --help` for the options. Each snake is
+driven by a policy, a function that takes the model and the index of the
+snake and returns the direction to move in. Policies are named from
+POLICIES or given as module:function.
+"""
+
+import argparse
+import importlib
+import random
+import time
+from snake import COL_STEPS, DIRECTIONS, ROW_STEPS
+from snake_game_model import SnakeGameModel
+from snake_game_bot_controller import contested_cells, find_move
+
+
+def straight_policy(model, index):
+    """
+    Keeps the snake going the way it is facing
+
+    Parameters:
+        model: An instance of the SnakeGameModel class
+        index: Integer representing which snake to move
+
+    Returns:
+        String of direction for the snake to move in
+    """
+    return model.snakes[index].direction
+
+
+def random_policy(model, index):
+    """
+    Moves the snake in a random direction
+
+    Parameters:
+        model: An instance of the SnakeGameModel class
+        index: Integer representing which snake to move
+
+    Returns:
+        String of direction for the snake to move in
+    """
+    del model, index
+    return random.choice(DIRECTIONS)
+
+
+def greedy_policy(model, index):
+    """
+    Moves the snake toward the nearest apple, avoiding walls, bodies and
+    cells another head could reach on the next step where it can
+
+    Ties are broken at random, and one move in twenty ignores the apples, so
+    two greedy snakes do not circle the same apple forever.
+
+    Parameters:
+        model: An instance of the SnakeGameModel class
+        index: Integer representing which snake to move
+
+    Returns:
+        String of direction for the snake to move in
+    """
+    head_row, head_col = model.snakes[index].head
+    contested = contested_cells(model, index)
+
+    wander = random.random() < 0.05
+    best_direction = model.snakes[index].direction
+    best_score = None
+    for direction, row_step, col_step in zip(DIRECTIONS, ROW_STEPS, COL_STEPS):
+        row, col = head_row + row_step, head_col + col_step
+        if not model.is_safe([row, col]):
+            continue
+        distance = 0
+        if not wander:
+            distance = min(
+                (
+                    abs(row - apple[0]) + abs(col - apple[1])
+                    for apple in model.apples
+                ),
+                default=0,
+            )
+        score = ((row, col) in contested, distance, random.random())
+        if best_score is None or score < best_score:
+            best_direction, best_score = direction, score
+    return best_direction
+
+
+POLICIES = {
+    "straight": straight_policy,
+    "random": random_policy,
+    "greedy": greedy_policy,
+    "bot": find_move,
+}
+
+
+def load_policy(name):
+    """
+    Gets a policy by name
+
+    Parameters:
+        name: String naming a policy in POLICIES or a function as
+            module:function
+
+    Returns:
+        function taking the model and a snake index and returning a direction
+    """
+    if name in POLICIES:
+        return POLICIES[name]
+    module_name, _, function_name = name.partition(":")
+    if not function_name:
+        raise ValueError(
+            f"Unknown policy {name!r}, expected one of "
+            f"{', '.join(POLICIES)} or module:function"
+        )
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def run_games(policies, num_games, max_ticks=2000, **model_options):
+    """
+    Plays games between policies and collects statistics
+
+    Parameters:
+        policies: list of policy functions, one for each snake
+        num_games: Integer representing the number of games to play
+        max_ticks: Integer representing the most ticks a game can last before
+            it is stopped with no winner
+        model_options: Keyword arguments passed on to SnakeGameModel
+
+    Returns:
+        dict with the number of games, ticks, elapsed seconds, ticks and
+        games per second, wins for each snake, ties and stopped games
+    """
+    model = SnakeGameModel(num_snakes=len(policies), **model_options)
+    indexes = range(len(policies))
+    wins = [0] * len(policies)
+    ties = 0
+    stopped = 0
+    ticks = 0
+
+    start = time.perf_counter()
+    for _ in range(num_games):
+        model.reset()
+        winners = (False,) * len(policies)
+        for _ in range(max_ticks):
+            model.move_snakes(
+                *(policy(model, index) for index, policy in enumerate(policies))
+            )
+            ticks += 1
+            winners = model.snake_won()
+            if True in winners:
+                break
+        if all(winners):
+            ties += 1
+        elif True in winners:
+            for index in indexes:
+                wins[index] += winners[index]
+        else:
+            stopped += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        "games": num_games,
+        "ticks": ticks,
+        "elapsed": elapsed,
+        "ticks_per_second": ticks / elapsed if elapsed else 0.0,
+        "games_per_second": num_games / elapsed if elapsed else 0.0,
+        "mean_ticks_per_game": ticks / num_games if num_games else 0.0,
+        "wins": wins,
+        "ties": ties,
+        "stopped": stopped,
+    }
+
+
+def main(argv=None):
+    """
+    Play headless games from the command line and print statistics
+
+    Parameters:
+        argv: list of strings of command line arguments, or None to use
+            sys.argv
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument(
+        "--policy",
+        action="append",
+        help="policy for the next snake (default: greedy for two snakes)",
+    )
+    parser.add_argument("--max-ticks", type=int, default=2000)
+    parser.add_argument("--width", type=int, default=19)
+    parser.add_argument("--height", type=int, default=19)
+    parser.add_argument("--apples", type=int, default=1)
+    parser.add_argument("--apples-to-win", type=int, default=10)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    policies = [load_policy(name) for name in args.policy or ["greedy"] * 2]
+    stats = run_games(
+        policies,
+        args.games,
+        max_ticks=args.max_ticks,
+        board_width=args.width,
+        board_height=args.height,
+        num_apples=args.apples,
+        apples_to_win=args.apples_to_win,
+    )
+
+    print(f"games:          {stats['games']}")
+    print(f"ticks:          {stats['ticks']}")
+    print(f"elapsed:        {stats['elapsed']:.3f} s")
+    print(f"ticks/second:   {stats['ticks_per_second']:,.0f}")
+    print(f"games/second:   {stats['games_per_second']:,.1f}")
+    print(f"ticks/game:     {stats['mean_ticks_per_game']:.1f}")
+    for index, wins in enumerate(stats["wins"]):
+        print(f"snake {index + 1} wins:   {wins}")
+    print(f"ties:           {stats['ties']}")
+    print(f"stopped:        {stats['stopped']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,90 @@
 """
-Class to represent the model of a two player game of snake
+Class to represent the model of a multiplayer game of snake
 """
 
 import random
-from snake import Snake
+from array import array
+from functools import lru_cache
+from snake import DIRECTION_CODES, Snake
 
+# Game ticks per second, which sets how fast the snakes move
+TICK_RATE = 7
 
+# Seeds must be below this to fit the 64 bits a replay stores them in
+_SEED_LIMIT = 1 << 64
+
+
+@lru_cache(maxsize=8)
+def _cell_range(num_cells):
+    """
+    Builds an int array of the indexes of every cell on a board
+
+    The array is cached so that resetting a game only copies it.
+
+    Parameters:
+        num_cells: Integer representing the number of cells on the board
+
+    Returns:
+        array of ints from 0 to num_cells - 1
+    """
+    return array("i", range(num_cells))
+
+
+# The board, snakes, apples and free cells are all state of one match, and
+# most public methods are read only properties of it
+# pylint: disable-next=too-many-instance-attributes,too-many-public-methods
 class SnakeGameModel:
     """
     Class to store and track the state of a snake game
 
+    Any number of snakes can play. Every tick all snakes move at once, then
+    every head is checked against the walls and the shared occupancy grid, so
+    a head dies if it lands on any segment of any snake, including another
+    head. The game ends on the first tick a snake dies: the survivors win, or
+    everyone ties if every snake died.
+
+    Each match draws its apples from its own random generator, seeded from
+    the global random module unless a seed is given, and logs the direction
+    every snake was given on every tick. The seed and the log are enough to
+    replay the match exactly.
+
     Attributes:
         board_width: int representing width of game board
         board_height: int representing height of game board
         snake_starting_length: int representing how long snakes start as
         num_apples: int representing how many apples on board
-        snake_one: instance of snake object
-        snake_two: instance of snake object
+        apples_to_win: int representing how many apples a snake must eat
+        to win
+        snakes: list of instances of snake object
+        snake_one: instance of snake object, the first snake
+        snake_two: instance of snake object, the second snake
         apples: list of lists with integer coords of apples
         game_state: integer representing phase of game (starting screen,
         playing game, ending screen)
+        seed: integer the random generator of the match was seeded with
+        move_log: bytes of the direction code each snake was given on each
+        tick of the match
+        default_start: bool of whether every snake started the match from
+        its default starting position
     """
 
-    _board_width = 19
-    _board_height = 19
-    _snake_starting_length = 4
-    _num_apples = 1
-
-    def __init__(
+    # The game options are keyword only, so only the four snake arguments
+    # kept for older callers count against the positional limit
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         snake_one_locations=None,
         snake_one_directions=None,
         snake_two_locations=None,
         snake_two_directions=None,
+        *,
+        board_width=19,
+        board_height=19,
+        snake_starting_length=4,
+        num_apples=1,
+        apples_to_win=10,
+        num_snakes=2,
+        snake_bodies=None,
+        seed=None,
     ):
         """
         Creates an instance of the SnakeGameState class
@@ -46,251 +98,423 @@ class SnakeGameModel:
             coords for snake two segments
             snake_two_directions: list of strings with initial directions for
             snake two segments
-        """
-        self._setup(
-            snake_one_locations=snake_one_locations,
-            snake_one_directions=snake_one_directions,
-            snake_two_locations=snake_two_locations,
-            snake_two_directions=snake_two_directions,
-        )
+            board_width: int representing width of game board
+            board_height: int representing height of game board
+            snake_starting_length: int representing how long snakes start as
+            num_apples: int representing how many apples on board
+            apples_to_win: int representing how many apples a snake must eat
+            to win
+            num_snakes: int representing how many snakes play
+            snake_bodies: list with a [locations, directions] pair, or None
+            for the default starting position, for each snake. The snake one
+            and snake two parameters take priority over the first two pairs
+            seed: int from 0 to 2**64 - 1 to seed the random generator of
+            the first match with, or None to draw one from the global random
+            module
+
+        Raises:
+            ValueError: if the seed is out of range
+        """
+        self._board_width = board_width
+        self._board_height = board_height
+        self._snake_starting_length = snake_starting_length
+        self._num_apples = num_apples
+        self._apples_to_win = apples_to_win
+
+        if snake_bodies is None:
+            snake_bodies = [None] * num_snakes
+        snake_bodies = list(snake_bodies)
+        self._num_snakes = len(snake_bodies)
+        if snake_one_locations is not None and snake_one_directions is not None:
+            snake_bodies[0] = [snake_one_locations, snake_one_directions]
+        if snake_two_locations is not None and snake_two_directions is not None:
+            snake_bodies[1] = [snake_two_locations, snake_two_directions]
+
+        self._setup(snake_bodies, seed)
         self._game_state = 1
 
-    def reset(self):
+    def reset(self, seed=None):
         """
         Resets the attributes to the default state
+
+        Parameters:
+            seed: int from 0 to 2**64 - 1 to seed the random generator of
+            the new match with, or None to draw one from the global random
+            module
+
+        Raises:
+            ValueError: if the seed is out of range
         """
-        self._setup()
+        self._setup(seed=seed)
 
-    def _setup(
-        self,
-        snake_one_locations=None,
-        snake_one_directions=None,
-        snake_two_locations=None,
-        snake_two_directions=None,
-    ):
+    def _setup(self, snake_bodies=None, seed=None):
         """
         Sets the attributes of the game to initial state
 
         Parameters:
-            snake_one_locations: list of lists containing initial integer
-            coords for snake one segments
-            snake_one_directions: list of strings with initial directions for
-            snake one segments
-            snake_two_locations: list of lists containing initial integer
-            coords for snake two segments
-            snake_two_directions: list of strings with initial directions for
-            snake two segments
-        """
-        if snake_one_locations is None or snake_one_directions is None:
-            self._snake_one = Snake(
-                [self._board_height // 2 - 1, (self._board_width // 2) - 5],
-                "RIGHT",
-                self._snake_starting_length,
-            )
-        else:
-            self._snake_one = Snake(
-                None,
-                None,
-                None,
-                locations_and_directions=[
-                    snake_one_locations,
-                    snake_one_directions,
-                ],
-            )
-        if snake_two_locations is None or snake_two_directions is None:
-            self._snake_two = Snake(
-                [self._board_height // 2 + 1, self._board_width // 2 + 5],
-                "LEFT",
-                self._snake_starting_length,
+            snake_bodies: list with a [locations, directions] pair, or None
+            for the default starting position, for each snake
+            seed: int from 0 to 2**64 - 1 to seed the random generator of
+            the match with, or None to draw one from the global random module
+
+        Raises:
+            ValueError: if the seed is out of range
+        """
+        if snake_bodies is None:
+            snake_bodies = [None] * self._num_snakes
+
+        # Drawing the seed from the global random module keeps matches
+        # repeatable with random.seed
+        if seed is None:
+            seed = random.getrandbits(32)
+        elif not 0 <= seed < _SEED_LIMIT:
+            raise ValueError(
+                f"Seed must be from 0 to {_SEED_LIMIT - 1}, got {seed}"
             )
-        else:
-            self._snake_two = Snake(
-                None,
-                None,
-                None,
-                locations_and_directions=[
-                    snake_two_locations,
-                    snake_two_directions,
-                ],
-            )
-
+        self._seed = seed
+        self._random = random.Random(self._seed)
+
+        # Direction code given to each snake on each tick, in snake order
+        self._move_log = bytearray()
+
+        self._default_start = all(body is None for body in snake_bodies)
+        self._snakes = []
+        for index, body in enumerate(snake_bodies):
+            if body is None:
+                head_location, direction = self._starting_position(index)
+                self._snakes.append(
+                    Snake(
+                        head_location,
+                        direction,
+                        self._snake_starting_length,
+                    )
+                )
+            else:
+                self._snakes.append(
+                    Snake(None, None, None, locations_and_directions=body)
+                )
+
+        # Collisions and winners for the current tick, None until computed
+        self._outcome = None
+
+        # Number of snake segments on each board cell, indexed row major
+        num_cells = self._board_width * self._board_height
+        self._occupancy = bytearray(num_cells)
+
+        # Cells with no snake or apple on them. Cells are removed by swapping
+        # in the last free cell, and _free_positions maps each cell to its
+        # index in _free_cells (or -1 if taken) so both updates are O(1)
+        self._free_cells = _cell_range(num_cells)[:]
+        self._free_positions = _cell_range(num_cells)[:]
+
+        # Maps the cell of each apple to its index in _apples
+        self._apple_cells = {}
+
+        for snake in self._snakes:
+            for location in snake.locations:
+                self._occupy(location)
+
+        # Space the apples evenly down the middle column, moving any that
+        # would land on a snake or another apple to a random free cell
         self._apples = []
         for i in range(1, self._num_apples + 1):
-            self._apples.append(
-                [
-                    i * (self._board_height // (self._num_apples + 1)),
-                    self.board_width // 2,
-                ]
+            apple = [
+                i * (self._board_height // (self._num_apples + 1)),
+                self._board_width // 2,
+            ]
+            cell = self._cell_index(apple)
+            if self._free_positions[cell] == -1:
+                cell = self._random_free_cell()
+                apple = [cell // self._board_width, cell % self._board_width]
+            self._apples.append(apple)
+            self._apple_cells[cell] = len(self._apples) - 1
+            self._update_free(cell)
+
+    def _starting_position(self, index):
+        """
+        Gets the default head location and direction of a snake
+
+        Snakes start on rows two apart around the middle of the board,
+        alternating between facing right from the left half and facing left
+        from the right half. Heads start five cells from the middle column,
+        or closer on boards too narrow for the whole snake to fit there.
+
+        Parameters:
+            index: Integer representing which snake to place
+
+        Returns:
+            list of two integers for row and col of the head
+            String representing the direction the snake is facing
+
+        Raises:
+            ValueError: if the snakes do not fit on the board
+        """
+        height = self._board_height
+        width = self._board_width
+        length = self._snake_starting_length
+        if self._num_snakes > (height + 1) // 2:
+            raise ValueError(
+                f"{self._num_snakes} snakes do not fit on a board "
+                f"{height} rows high, which fits {(height + 1) // 2}"
             )
+        if length > width:
+            raise ValueError(
+                f"Snakes of length {length} do not fit on a board "
+                f"{width} columns wide"
+            )
+
+        row = height // 2 - (self._num_snakes - 1) + 2 * index
+        if index % 2 == 0:
+            return [row, max(width // 2 - 5, length - 1)], "RIGHT"
+        return [row, min(width // 2 + 5, width - length)], "LEFT"
 
-    def move_snakes(self, snake_one_direction, snake_two_direction):
+    def move_snakes(self, *directions):
         """
-        Advance the snake in the indicated direction and return if either
-        has died
+        Advance every snake one step in its indicated direction
+
+        All snakes move before anything is checked, so a head may move into
+        a cell that another snake's tail leaves on the same tick.
 
         Parameters:
-            snake_one_direction: String of direction for snake one to move in
-            snake_two_direction: String of direction for snake two to move in
+            directions: String of direction for each snake to move in, in
+            the order of snakes
         """
-        self._snake_one.move(snake_one_direction)
-        self._snake_two.move(snake_two_direction)
+        if len(directions) != self._num_snakes:
+            raise ValueError(
+                f"Expected {self._num_snakes} directions, got {len(directions)}"
+            )
+
+        for snake, direction in zip(self._snakes, directions):
+            self._vacate(snake.tail)
+            snake.move(direction)
+            self._move_log.append(DIRECTION_CODES[direction])
+            self._occupy(snake.head)
 
         self._check_and_eat()
+        self._outcome = self._compute_outcome()
 
     def snake_won(self):
         """
-        Checks whether a player has won or not
+        Checks whether each player has won or not
 
         Returns:
-            bool: whether snake one has won
-            bool: whether snake two has won
+            tuple of bools: whether each snake has won, in the order of
+            snakes
         """
-
-        snake_one_won = False
-        snake_two_won = False
-
-        if self._collision()[0] and self._collision()[1]:
-            snake_one_won = True
-            snake_two_won = True
-        elif self._collision()[1] or self._snake_one.apples_eaten == 10:
-            snake_one_won = True
-        elif self._collision()[0] or self._snake_two.apples_eaten == 10:
-            snake_two_won = True
-
-        return snake_one_won, snake_two_won
+        self._collision()
+        return self._tick_outcome()[1]
 
     def _collision(self):
         """
-        Checks if either snake has collided with itself, each other, or wall
+        Checks if any snake has collided with itself, another snake, or wall
 
         Returns:
-            bool: whether snake one has died
-            bool: whether snake two has died
+            tuple of bools: whether each snake has died
         """
-        collision_one = False
-        collision_two = False
-        wall_collision_one, wall_collision_two = self._wall_collision()
-        snake_collision_one, snake_collision_two = self._snake_collision()
-
-        if wall_collision_one or snake_collision_one:
-            collision_one = True
-        if wall_collision_two or snake_collision_two:
-            collision_two = True
+        collisions = self._tick_outcome()[0]
 
-        if collision_one or collision_two:
+        if True in collisions:
             self._game_state = 3
 
-        return collision_one, collision_two
+        return collisions
 
-    def _wall_collision(self):
+    def _tick_outcome(self):
         """
-        Checks if either snake has collided with itself or each other
+        Gets the collisions and winners for the current positions
+
+        The outcome is computed at most once per tick. move_snakes stores it
+        after moving, and it is computed on first use after a reset.
 
         Returns:
-            bool: whether snake one has collided
-            bool: whether snake two has collided
-        """
-        snake_one = False
-        snake_two = False
-
-        # Check that snake one head still in x bounds
-        if (
-            self._snake_one.locations[0][1] < 0
-            or self._snake_one.locations[0][1] >= self.board_width
-        ):
-            snake_one = True
-
-        # Check that snake one head still in y bounds
-        if (
-            self._snake_one.locations[0][0] < 0
-            or self._snake_one.locations[0][0] >= self.board_height
-        ):
-            snake_one = True
-
-        # Check that snake two head still in x bounds
-        if (
-            self._snake_two.locations[0][1] < 0
-            or self._snake_two.locations[0][1] >= self.board_width
-        ):
-            snake_two = True
-
-        # Check that snake two head still in y bounds
-        if (
-            self._snake_two.locations[0][0] < 0
-            or self._snake_two.locations[0][0] >= self.board_height
-        ):
-            snake_two = True
-
-        return snake_one, snake_two
-
-    def _snake_collision(self):
-        """
-        Checks if either snake has collided with itself or each other
+            tuple of bools: whether each snake has died
+            tuple of bools: whether each snake has won
+        """
+        if self._outcome is None:
+            self._outcome = self._compute_outcome()
+        return self._outcome
+
+    def _compute_outcome(self):
+        """
+        Checks the snakes for collisions and decides who has won
+
+        If any snake has died the survivors win, or every snake wins (a tie)
+        if none survived. Otherwise the snakes that have eaten enough apples
+        win.
 
         Returns:
-            bool: whether snake one has collided
-            bool: whether snake two has collided
+            tuple of bools: whether each snake has died
+            tuple of bools: whether each snake has won
         """
-        snake_one = False
-        snake_two = False
+        collisions = tuple(
+            self._head_collision(snake) for snake in self._snakes
+        )
 
-        # Check that snake one head hasn't collided with self
-        for i in range(1, len(self._snake_one.locations)):
-            if self._snake_one.locations[0] == self._snake_one.locations[i]:
-                snake_one = True
+        if all(collisions):
+            winners = (True,) * self._num_snakes
+        elif any(collisions):
+            winners = tuple(not collision for collision in collisions)
+        else:
+            winners = tuple(
+                snake.apples_eaten >= self._apples_to_win
+                for snake in self._snakes
+            )
 
-        # Check that snake one hasn't collided with snake two
-        for coord in self._snake_two.locations:
-            if self._snake_one.locations[0] == coord:
-                snake_one = True
+        return collisions, winners
 
-        # Check that snake two head hasn't collided with self
-        for i in range(1, len(self._snake_two.locations)):
-            if self._snake_two.locations[0] == self._snake_two.locations[i]:
-                snake_two = True
+    def _head_collision(self, snake):
+        """
+        Checks if a snake head has left the board or landed on a segment of
+        any snake
 
-        # Check that snake two hasn't collided with snake one
-        for coord in self._snake_one.locations:
-            if self._snake_two.locations[0] == coord:
-                snake_two = True
+        Parameters:
+            snake: instance of snake object
 
-        return snake_one, snake_two
+        Returns:
+            bool: whether the snake has died
+        """
+        row, col = snake.head
+        if 0 <= row < self._board_height and 0 <= col < self._board_width:
+            return self._occupancy[row * self._board_width + col] > 1
+        return True
 
     def _check_and_eat(self):
         """
-        Checks if the snake is eating and if so grows and generates new apple
+        Checks if the snakes are eating and if so grows them and generates
+        new apples
         """
-        # Check and grow snake one
         eaten_indexes = []
-        for i, apple in enumerate(self._apples):
-            if self._snake_one.locations[0] == apple:
-                eaten_indexes.append(i)
-                self._snake_one.grow()
-            if self._snake_two.locations[0] == apple:
-                eaten_indexes.append(i)
-                self._snake_two.grow()
+        for snake in self._snakes:
+            head = snake.head
+            if not self._in_bounds(head):
+                continue
+            index = self._apple_cells.get(self._cell_index(head))
+            if index is not None:
+                if index not in eaten_indexes:
+                    eaten_indexes.append(index)
+                snake.grow()
+                self._occupy(snake.tail)
 
         for index in eaten_indexes:
             self._new_apple(index)
 
+    def is_safe(self, location):
+        """
+        Checks whether a location is on the board with no snake on it
+
+        Parameters:
+            location: list of two integers for row and col of a cell
+
+        Returns:
+            bool: whether a head could move to the location without dying,
+            ignoring other snakes moving on the same tick
+        """
+        return (
+            self._in_bounds(location)
+            and self._occupancy[self._cell_index(location)] == 0
+        )
+
+    def _in_bounds(self, location):
+        """
+        Checks whether a location is on the board
+
+        Parameters:
+            location: list of two integers for row and col of a cell
+
+        Returns:
+            bool: whether the location is on the board
+        """
+        return (
+            0 <= location[0] < self._board_height
+            and 0 <= location[1] < self._board_width
+        )
+
+    def _cell_index(self, location):
+        """
+        Converts an on board location to its index in the occupancy grid
+
+        Parameters:
+            location: list of two integers for row and col of a cell
+
+        Returns:
+            int: row major index of the cell
+        """
+        return location[0] * self._board_width + location[1]
+
+    def _occupy(self, location):
+        """
+        Records a snake segment entering a cell
+
+        Segments off the board are not tracked, since a head off the board is
+        already a wall collision.
+
+        Parameters:
+            location: list of two integers for row and col of the segment
+        """
+        if self._in_bounds(location):
+            cell = self._cell_index(location)
+            self._occupancy[cell] += 1
+            self._update_free(cell)
+
+    def _vacate(self, location):
+        """
+        Records a snake segment leaving a cell
+
+        Parameters:
+            location: list of two integers for row and col of the segment
+        """
+        if self._in_bounds(location):
+            cell = self._cell_index(location)
+            self._occupancy[cell] -= 1
+            self._update_free(cell)
+
+    def _update_free(self, cell):
+        """
+        Adds or removes a cell from the free cells after it has changed
+
+        Parameters:
+            cell: Integer representing the row major index of the cell
+        """
+        free = self._occupancy[cell] == 0 and cell not in self._apple_cells
+        position = self._free_positions[cell]
+        if free and position == -1:
+            self._free_positions[cell] = len(self._free_cells)
+            self._free_cells.append(cell)
+        elif not free and position != -1:
+            last_cell = self._free_cells.pop()
+            if last_cell != cell:
+                self._free_cells[position] = last_cell
+                self._free_positions[last_cell] = position
+            self._free_positions[cell] = -1
+
     def _new_apple(self, old_index):
         """
-        Change apple location at index to new location
+        Change apple location at index to a random cell with no snake or
+        apple on it
 
         Parameters:
             old_index: Integer representing the index of the apple to update
         """
-        empty_spaces = []
-        for row in range(self._board_height):
-            for col in range(self._board_width):
-                if (
-                    [row, col] not in self._snake_one.locations
-                    and [row, col] not in self._snake_two.locations
-                    and [row, col] not in self._apples
-                ):
-                    empty_spaces.append([row, col])
+        old_cell = self._cell_index(self._apples[old_index])
+        new_cell = self._random_free_cell()
+
+        del self._apple_cells[old_cell]
+        self._apple_cells[new_cell] = old_index
+        self._update_free(old_cell)
+        self._update_free(new_cell)
+
+        self._apples[old_index] = [
+            new_cell // self._board_width,
+            new_cell % self._board_width,
+        ]
+
+    def _random_free_cell(self):
+        """
+        Picks a uniformly random cell with no snake or apple on it
 
-        self._apples[old_index] = random.choice(empty_spaces)
+        Returns:
+            int: row major index of the cell
+        """
+        return self._free_cells[self._random.randrange(len(self._free_cells))]
 
     def set_game_state(self, new_state):
         """
@@ -301,49 +525,47 @@ class SnakeGameModel:
         """
         self._game_state = new_state
 
+    # Body and head characters of each snake when printed
+    _snake_characters = [
+        ("■", {"UP": "▲", "DOWN": "▼", "LEFT": "◀", "RIGHT": "▶"}),
+        ("□", {"UP": "△", "DOWN": "▽", "LEFT": "◁", "RIGHT": "▷"}),
+        ("●", {"UP": "↑", "DOWN": "↓", "LEFT": "←", "RIGHT": "→"}),
+        ("○", {"UP": "⇑", "DOWN": "⇓", "LEFT": "⇐", "RIGHT": "⇒"}),
+    ]
+
     def __repr__(self):
         """
         Defines how the map would be printed
         """
         empty_space = " "
-        snake_one_body = "■"
-        snake_two_body = "□"
-        snake_one_heads = {"UP": "▲", "DOWN": "▼", "LEFT": "◀", "RIGHT": "▶"}
-        snake_two_heads = {"UP": "△", "DOWN": "▽", "LEFT": "◁", "RIGHT": "▷"}
         apple = "◈"
         wall = "▩"
 
-        output = ""
-        for row in range(self.board_height + 2):
-            line = ""
-            for col in range(self.board_width + 2):
-                if row in (0, self.board_height + 1) or col in (
-                    0,
-                    self.board_width + 1,
-                ):
-                    line += wall
-                else:
-                    board_row, board_col = row - 1, col - 1
-                    board_pos = [board_row, board_col]
-
-                    if board_pos in self.snake_one.locations:
-                        line += (
-                            snake_one_heads[self.snake_one.directions[0]]
-                            if board_pos == self.snake_one.locations[0]
-                            else snake_one_body
-                        )
-                    elif board_pos in self.snake_two.locations:
-                        line += (
-                            snake_two_heads[self.snake_two.directions[0]]
-                            if board_pos == self.snake_two.locations[0]
-                            else snake_two_body
-                        )
-                    elif board_pos in self.apples:
-                        line += apple
-                    else:
-                        line += empty_space
-            output += line + "\n"
-        return output
+        # Fill in a grid of characters, drawing the snakes in reverse so the
+        # first snake is on top where snakes overlap
+        grid = [
+            [wall] + [empty_space] * self._board_width + [wall]
+            for _ in range(self._board_height)
+        ]
+        for row, col in self._apples:
+            grid[row][col + 1] = apple
+        for index in reversed(range(self._num_snakes)):
+            snake = self._snakes[index]
+            body, heads = self._snake_characters[
+                index % len(self._snake_characters)
+            ]
+            locations = snake.locations
+            for location in reversed(locations[1:]):
+                if self._in_bounds(location):
+                    grid[location[0]][location[1] + 1] = body
+            if self._in_bounds(locations[0]):
+                grid[locations[0][0]][locations[0][1] + 1] = heads[
+                    snake.direction
+                ]
+
+        wall_line = wall * (self._board_width + 2)
+        lines = [wall_line] + ["".join(line) for line in grid] + [wall_line]
+        return "\n".join(lines) + "\n"
 
     @property
     def game_state(self):
@@ -373,6 +595,37 @@ class SnakeGameModel:
         """
         return self._snake_starting_length
 
+    @property
+    def num_apples(self):
+        """
+        Returns the number of apples on the board as an int
+        """
+        return self._num_apples
+
+    @property
+    def apples_to_win(self):
+        """
+        Returns the number of apples a snake must eat to win as an int
+        """
+        return self._apples_to_win
+
+    @property
+    def num_snakes(self):
+        """
+        Returns the number of snakes playing as an int
+        """
+        return self._num_snakes
+
+    @property
+    def snakes(self):
+        """
+        Gets every snake
+
+        Returns:
+            list of Snake: instances of snake class in player order
+        """
+        return self._snakes
+
     @property
     def snake_one(self):
         """
@@ -381,7 +634,7 @@ class SnakeGameModel:
         Returns:
             Snake: instance of snake class
         """
-        return self._snake_one
+        return self._snakes[0]
 
     @property
     def snake_two(self):
@@ -391,7 +644,7 @@ class SnakeGameModel:
         Returns:
             Snake: instance of snake class
         """
-        return self._snake_two
+        return self._snakes[1]
 
     @property
     def apples(self):
@@ -399,3 +652,58 @@ class SnakeGameModel:
         Returns the location of the apples as a list of list of coordinates
         """
         return self._apples
+
+    @property
+    def occupancy(self):
+        """
+        Gets how many snake segments are on each cell, for searching the
+        board without calling is_safe on every cell
+
+        Returns:
+            memoryview: read only bytes of the number of segments on each
+            cell, in row major order
+        """
+        return memoryview(self._occupancy).toreadonly()
+
+    @property
+    def seed(self):
+        """
+        Gets the seed of the random generator of the match
+
+        Returns:
+            int: the seed the match was set up with
+        """
+        return self._seed
+
+    @property
+    def default_start(self):
+        """
+        Gets whether the snakes started the match from their default starting
+        positions, which replays can only record matches from
+
+        Returns:
+            bool: True if no snake was given a starting body
+        """
+        return self._default_start
+
+    @property
+    def ticks(self):
+        """
+        Gets the number of ticks played in the match
+
+        Returns:
+            int: the number of times move_snakes was called since the match
+            was set up
+        """
+        return len(self._move_log) // self._num_snakes
+
+    @property
+    def move_log(self):
+        """
+        Gets the direction each snake was given on each tick of the match
+
+        Returns:
+            bytes: the code in DIRECTIONS of each direction, one byte per
+            snake per tick, in the order of snakes then ticks
+        """
+        return bytes(self._move_log)
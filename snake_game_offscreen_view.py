@@ -0,0 +1,63 @@
+"""
+Class to draw the game into memory instead of a window, for servers with
+no display and recordings
+"""
+
+import pygame
+from snake_game_graphical_view import GraphicalView
+
+
+class OffscreenView(GraphicalView):
+    """
+    A class inheriting from the GraphicalView class to draw the game exactly
+    as the window would show it, but into a surface in memory
+
+    No window is opened, so it works without a display.
+    """
+
+    def _make_screen(self, width, height):
+        """
+        Makes the surface to draw on in place of a window
+
+        Parameters:
+            width: An integer representing the width of the frame
+            height: An integer representing the height of the frame
+
+        Returns:
+            A surface to draw on
+        """
+        return pygame.Surface((width, height))
+
+    def draw(self, frame_rate=0, interpolation=None):
+        """
+        Draws the current state of the game into the frame
+
+        Parameters:
+            frame_rate: Ignored, as frames are drawn as fast as asked for
+            interpolation: A float from 0 to 1 of the way through the time
+                between the last tick and the next, to draw the snakes part
+                way through their moves, or None to draw them in their cells
+        """
+        del frame_rate
+        self._render(interpolation)
+
+    @property
+    def frame(self):
+        """
+        Gets the pixels of the frame without copying them
+
+        The array is a view of the surface, which stays locked while the
+        array exists, so delete it (or copy it) before drawing again.
+
+        Returns:
+            A NumPy array of uint8 indexed by [y, x, channel] with the red,
+            green and blue of each pixel
+        """
+        return pygame.surfarray.pixels3d(self._screen).transpose(1, 0, 2)
+
+    @property
+    def surface(self):
+        """
+        Returns the surface the game is drawn on
+        """
+        return self._screen
@@ -0,0 +1,212 @@
+"""
+Class to record the frames a view draws to a file on a background thread,
+and a function to read the recording back
+
+A recording starts with a header of MAGIC and the width and height of the
+frames, then holds each frame as its length and its RGB pixels compressed
+with zlib, row by row from the top left. Every frame is the size of the
+first one captured: frames captured after the window is resized are scaled
+to it.
+"""
+
+import queue
+import struct
+import threading
+import time
+import zlib
+import pygame
+
+# First bytes of every recording
+MAGIC = b"SNAKEREC"
+
+# Width and height after MAGIC, and the length before each frame
+_HEADER = struct.Struct("<II")
+_FRAME_LENGTH = struct.Struct("<I")
+
+
+class FrameRecorder:
+    """
+    A class that records frames to a file without slowing the game
+
+    Capturing a frame only copies the surface and queues the copy. A
+    background thread scales, converts and compresses queued frames and
+    writes them, and zlib releases the GIL while compressing, so the game
+    keeps running.
+    When the queue is full the newest frame is dropped, or with block set
+    the game waits for room.
+
+    Attributes:
+        _file: A binary file the recording is written to
+        _queue: A queue of surfaces waiting to be written, with None to
+            stop the thread
+        _block: A bool of whether capturing waits for room in the queue
+        _compression: An integer zlib compression level from 0 to 9
+        _frame_interval: A float of the least seconds between captured
+            frames, 0 to capture every frame
+        _last_capture: A float of the time.perf_counter time of the last
+            captured frame, or None
+        _size: A tuple of the width and height of the frames, or None
+            before the first frame
+        _captured: An integer of the frames queued
+        _dropped: An integer of the frames dropped because the queue was full
+        _written: An integer of the frames written
+        _bytes_written: An integer of the compressed bytes written
+        _encode_seconds: A float of the seconds spent converting and
+            compressing frames
+        _thread: The thread writing frames
+    """
+
+    def __init__(
+        self,
+        path,
+        max_queued_frames=32,
+        block=False,
+        frame_rate=15,
+        compression=1,
+    ):
+        """
+        Opens the recording and starts the thread writing it
+
+        Parameters:
+            path: A string of the path of the file to record to
+            max_queued_frames: An integer of the most frames waiting to be
+                written before frames are dropped or capturing blocks
+            block: A bool of whether capturing a frame waits for room in a
+                full queue instead of dropping the frame
+            frame_rate: An integer of the most frames to record per second,
+                skipping any drawn in between, or None to record every frame
+            compression: An integer zlib compression level from 0 to 9
+        """
+        # pylint: disable=consider-using-with
+        self._file = open(path, "wb")
+        self._queue = queue.Queue(max_queued_frames)
+        self._block = block
+        self._compression = compression
+        self._frame_interval = 1 / frame_rate if frame_rate else 0
+        self._last_capture = None
+        self._size = None
+        self._captured = 0
+        self._dropped = 0
+        self._written = 0
+        self._bytes_written = 0
+        self._encode_seconds = 0.0
+        self._thread = threading.Thread(target=self._write_frames, daemon=True)
+        self._thread.start()
+
+    def capture(self, surface):
+        """
+        Queues a copy of a frame to be written
+
+        Frames drawn sooner after the last captured frame than the frame rate
+        allows are skipped without being counted.
+
+        Parameters:
+            surface: A surface of the frame, scaled to the size of the first
+                frame captured when the window has been resized since
+        """
+        now = time.perf_counter()
+        if (
+            self._last_capture is not None
+            and now - self._last_capture < self._frame_interval
+        ):
+            return
+        if self._size is None:
+            self._size = surface.get_size()
+            self._file.write(MAGIC + _HEADER.pack(*self._size))
+        self._last_capture = now
+
+        try:
+            self._queue.put(surface.copy(), block=self._block)
+            self._captured += 1
+        except queue.Full:
+            self._dropped += 1
+
+    def _write_frames(self):
+        """
+        Scales, converts, compresses and writes queued frames until told to
+        stop
+        """
+        while True:
+            surface = self._queue.get()
+            if surface is None:
+                return
+            start = time.perf_counter()
+            if surface.get_size() != self._size:
+                surface = pygame.transform.smoothscale(surface, self._size)
+            data = zlib.compress(
+                pygame.image.tobytes(surface, "RGB"), self._compression
+            )
+            self._encode_seconds += time.perf_counter() - start
+            self._file.write(_FRAME_LENGTH.pack(len(data)) + data)
+            self._written += 1
+            self._bytes_written += len(data)
+
+    def close(self):
+        """
+        Writes every queued frame, stops the thread and closes the file
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._file.close()
+
+    def __enter__(self):
+        """
+        Returns the recorder, to close it at the end of a with block
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Closes the recorder at the end of a with block
+        """
+        self.close()
+
+    def stats(self):
+        """
+        Gets how the recording is keeping up with the game
+
+        Returns:
+            dict with the frames captured, dropped and written, the
+            compressed bytes written, the seconds spent encoding, and the
+            frames and megabytes of raw pixels encoded per second
+        """
+        encode_seconds = self._encode_seconds
+        width, height = self._size or (0, 0)
+        raw_bytes = self._written * width * height * 3
+        return {
+            "captured": self._captured,
+            "dropped": self._dropped,
+            "written": self._written,
+            "bytes_written": self._bytes_written,
+            "encode_seconds": encode_seconds,
+            "frames_per_second": (
+                self._written / encode_seconds if encode_seconds else 0.0
+            ),
+            "megabytes_per_second": (
+                raw_bytes / 1e6 / encode_seconds if encode_seconds else 0.0
+            ),
+        }
+
+
+def read_frames(path):
+    """
+    Reads the frames of a recording
+
+    Parameters:
+        path: A string of the path of the recording
+
+    Yields:
+        tuple of the width and height of the frame and bytes of its RGB
+        pixels, row by row from the top left
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a recording")
+        size = _HEADER.unpack(file.read(_HEADER.size))
+        while True:
+            length = file.read(_FRAME_LENGTH.size)
+            if not length:
+                return
+            data = file.read(_FRAME_LENGTH.unpack(length)[0])
+            yield size, zlib.decompress(data)
@@ -0,0 +1,397 @@
+"""
+Record matches as their seed and moves, and replay them exactly
+
+Run `python snake_game_replay.py FILE` to replay a match as fast as
+possible and check it ends as it did when recorded, or add --view to
+watch it. A replay file starts with MAGIC, then a header of the game
+options, the seed and the number of ticks, then a digest of the state the
+match ended in, then the move log packed four direction codes to a byte.
+Matches must start from the default starting positions to be replayed.
+"""
+
+import argparse
+import hashlib
+import struct
+import sys
+import time
+from snake_game_controller import SnakeGameController
+from snake_game_model import TICK_RATE, SnakeGameModel
+
+# First bytes of every replay
+MAGIC = b"SNAKELOG"
+
+# Board width and height, snake starting length, number of apples, apples to
+# win, number of snakes, seed and number of ticks after MAGIC
+_HEADER = struct.Struct("<6IQI")
+
+# Bytes in a state digest
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+# Names of the model options in the order of the header
+_OPTIONS = (
+    "board_width",
+    "board_height",
+    "snake_starting_length",
+    "num_apples",
+    "apples_to_win",
+    "num_snakes",
+)
+
+# Direction codes packed in each byte of a replay file
+_CODES_PER_BYTE = 4
+
+
+def state_digest(model):
+    """
+    Hashes everything a match has ended with, to check a replay ends the
+    same
+
+    Parameters:
+        model: An instance of the SnakeGameModel class
+
+    Returns:
+        bytes of a SHA-256 digest of the locations, directions and apples
+        eaten of every snake, the apples and the winners
+    """
+    digest = hashlib.sha256()
+    for snake in model.snakes:
+        digest.update(
+            repr(
+                (snake.locations, snake.directions, snake.apples_eaten)
+            ).encode()
+        )
+    digest.update(repr((model.apples, model.snake_won())).encode())
+    return digest.digest()
+
+
+def _pack(codes):
+    """
+    Packs direction codes from 0 to 3 into two bits each
+
+    Parameters:
+        codes: bytes of direction codes
+
+    Returns:
+        bytes with four codes to a byte, the first in the lowest bits
+    """
+    packed = bytearray(-(-len(codes) // _CODES_PER_BYTE))
+    for index, code in enumerate(codes):
+        byte, slot = divmod(index, _CODES_PER_BYTE)
+        packed[byte] |= code << slot * 2
+    return bytes(packed)
+
+
+def _unpack(packed, count):
+    """
+    Unpacks direction codes packed by _pack
+
+    Parameters:
+        packed: bytes with four codes to a byte
+        count: Integer representing the number of codes packed
+
+    Returns:
+        bytes of the direction codes
+    """
+    return bytes(
+        packed[index // _CODES_PER_BYTE] >> index % _CODES_PER_BYTE * 2 & 3
+        for index in range(count)
+    )
+
+
+class Replay:
+    """
+    A class holding everything needed to replay a match: the options of its
+    model, the seed of its random generator and the moves of every tick
+
+    Attributes:
+        _options: A dictionary of the keyword arguments to make the model
+            with
+        _seed: An integer the random generator of the match was seeded with
+        _moves: Bytes of the direction code each snake was given on each
+            tick
+        _digest: Bytes of the state_digest of the match when it was recorded
+    """
+
+    def __init__(self, options, seed, moves, digest):
+        """
+        Initializes an instance of the Replay class
+
+        Parameters:
+            options: A dictionary of the keyword arguments to make the model
+                with, one for each name in _OPTIONS
+            seed: An integer the random generator of the match was seeded
+                with
+            moves: Bytes of the direction code each snake was given on each
+                tick, in the order of snakes then ticks
+            digest: Bytes of the state_digest of the match when it was
+                recorded
+        """
+        self._options = dict(options)
+        self._seed = seed
+        self._moves = bytes(moves)
+        self._digest = digest
+
+    @classmethod
+    def from_model(cls, model):
+        """
+        Records the match a model has played so far
+
+        Parameters:
+            model: An instance of the SnakeGameModel class
+
+        Returns:
+            An instance of the Replay class
+
+        Raises:
+            ValueError: if the snakes did not start from their default
+                starting positions
+        """
+        if not model.default_start:
+            raise ValueError(
+                "Only matches from the default starting positions can be "
+                "replayed"
+            )
+        options = {name: getattr(model, name) for name in _OPTIONS}
+        return cls(options, model.seed, model.move_log, state_digest(model))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a replay from a file
+
+        Parameters:
+            path: A string of the path of the replay
+
+        Returns:
+            An instance of the Replay class
+        """
+        with open(path, "rb") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a replay")
+            *values, seed, ticks = _HEADER.unpack(file.read(_HEADER.size))
+            options = dict(zip(_OPTIONS, values))
+            digest = file.read(_DIGEST_SIZE)
+            moves = _unpack(file.read(), ticks * options["num_snakes"])
+        return cls(options, seed, moves, digest)
+
+    def save(self, path):
+        """
+        Writes the replay to a file
+
+        Parameters:
+            path: A string of the path of the file to write
+        """
+        header = _HEADER.pack(
+            *(self._options[name] for name in _OPTIONS),
+            self._seed,
+            self.ticks,
+        )
+        with open(path, "wb") as file:
+            file.write(MAGIC + header + self._digest + _pack(self._moves))
+
+    def new_model(self):
+        """
+        Makes a model set up as the match started
+
+        Returns:
+            An instance of the SnakeGameModel class
+        """
+        return SnakeGameModel(**self._options, seed=self._seed)
+
+    @property
+    def options(self):
+        """
+        Returns a dictionary of the keyword arguments to make the model with
+        """
+        return dict(self._options)
+
+    @property
+    def seed(self):
+        """
+        Returns the seed of the random generator of the match
+        """
+        return self._seed
+
+    @property
+    def moves(self):
+        """
+        Returns bytes of the direction code each snake was given on each tick
+        """
+        return self._moves
+
+    @property
+    def digest(self):
+        """
+        Returns bytes of the state_digest of the match when it was recorded
+        """
+        return self._digest
+
+    @property
+    def ticks(self):
+        """
+        Returns the number of ticks in the match
+        """
+        return len(self._moves) // self._options["num_snakes"]
+
+
+class ReplayController(SnakeGameController):
+    """
+    A class inheriting from the SnakeGameController class to move the snakes
+    as they were moved in a recorded match
+
+    Attributes:
+        _moves: Bytes of the direction code each snake was given on each
+            tick
+        _num_snakes: An integer of the number of snakes moved each tick
+        _tick: An integer of the ticks replayed
+    """
+
+    def __init__(self, model, replay):
+        """
+        Initializes an instance of the ReplayController class
+
+        Parameters:
+            model: An instance of the SnakeGameModel class, made with the
+                new_model method of the replay
+            replay: An instance of the Replay class
+        """
+        super().__init__(model)
+        self._moves = replay.moves
+        self._num_snakes = model.num_snakes
+        self._tick = 0
+
+    def move(self):
+        """
+        Moves the snakes as they were moved on the next tick of the match
+        """
+        start = self._tick * self._num_snakes
+        self._model.move_snakes(*self._moves[start : start + self._num_snakes])
+        self._tick += 1
+
+    @property
+    def finished(self):
+        """
+        Returns whether every tick of the match has been replayed
+        """
+        return self._tick * self._num_snakes >= len(self._moves)
+
+
+def replay_match(
+    replay, model=None, view=None, tick_rate=0, handle_events=None
+):
+    """
+    Replays a match and checks that it ends exactly as it did
+
+    Parameters:
+        replay: An instance of the Replay class
+        model: An instance of the SnakeGameModel class made with the
+            new_model method of the replay, or None to make one
+        view: An instance of the SnakeGameView class of the model to draw
+            every tick with, or None to replay as fast as possible
+        tick_rate: An integer of the ticks to draw per second, or 0 to draw
+            them as fast as possible
+        handle_events: A function taking no arguments to call before
+            drawing each tick, such as handle_window_events, or None
+
+    Returns:
+        The instance of the SnakeGameModel class at the end of the match
+
+    Raises:
+        ValueError: if the match ends differently to when it was recorded
+    """
+    if model is None:
+        model = replay.new_model()
+    controller = ReplayController(model, replay)
+    model.set_game_state(2)
+
+    def draw():
+        if handle_events is not None:
+            handle_events()
+        if view is not None:
+            view.draw(tick_rate)
+
+    draw()
+    while not controller.finished:
+        controller.move()
+        draw()
+    if True in model.snake_won():
+        model.set_game_state(3)
+        draw()
+
+    if state_digest(model) != replay.digest:
+        raise ValueError(
+            f"Replay of seed {replay.seed} ended differently after "
+            f"{replay.ticks} ticks"
+        )
+    return model
+
+
+def handle_window_events():
+    """
+    Reads the pygame events of the window a replay is drawn in, so it keeps
+    responding, and quits when it is closed as GraphicalController does
+    """
+    # Imported here so replaying without a window does not need pygame
+    # pylint: disable=import-outside-toplevel
+    import pygame
+
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+
+
+def main(argv=None):
+    """
+    Replay a match from the command line and check it ends as recorded
+
+    Parameters:
+        argv: list of strings of command line arguments, or None to use
+            sys.argv
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("replay", help="file the match was recorded to")
+    parser.add_argument(
+        "--view", action="store_true", help="watch the match in a window"
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="times the game's tick rate to watch at (default: 1)",
+    )
+    parser.add_argument("--width", type=int, default=1400)
+    parser.add_argument("--height", type=int, default=1050)
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.replay)
+    model = replay.new_model()
+    view = None
+    tick_rate = 0
+    handle_events = None
+    if args.view:
+        # Imported here so replaying without a window does not need pygame
+        # pylint: disable=import-outside-toplevel
+        from snake_game_graphical_view import GraphicalView
+
+        view = GraphicalView(model, args.width, args.height)
+        tick_rate = TICK_RATE * args.speed
+        handle_events = handle_window_events
+
+    start = time.perf_counter()
+    try:
+        replay_match(replay, model, view, tick_rate, handle_events)
+    except ValueError as error:
+        sys.exit(str(error))
+    elapsed = time.perf_counter() - start
+
+    print(f"ticks:          {replay.ticks}")
+    print(f"elapsed:        {elapsed:.3f} s")
+    if elapsed:
+        print(f"ticks/second:   {replay.ticks / elapsed:,.0f}")
+    print(f"apples eaten:   {[snake.apples_eaten for snake in model.snakes]}")
+    print("final state:    identical to the recording")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Class to view the game as text in a terminal, for debugging over SSH and
+logging live matches
+"""
+
+import sys
+import time
+from snake_game_view import SnakeGameView
+
+# ANSI escape codes to clear the screen and to move the cursor to a row and
+# col, counted from 1
+_CLEAR = "\x1b[2J\x1b[H"
+_MOVE = "\x1b[{};{}H"
+_CLEAR_LINE = "\x1b[2K"
+
+
+class TerminalView(SnakeGameView):
+    """
+    A class inheriting from the SnakeGameView class to display the game as
+    the text of SnakeGameModel.__repr__ with the scores below it
+
+    In interactive mode the first frame clears the terminal and each later
+    frame only moves the cursor to the characters that changed and rewrites
+    them. Otherwise each frame that differs from the last is written in
+    full, one after another, which suits logs and pipes.
+
+    Attributes:
+        _stream: A text file the frames are written to
+        _interactive: A bool of whether frames are drawn as diffs in place
+        _lines: A list of the strings of each line of the last frame, or
+            None before the first frame
+        _next_frame: A float of the time.perf_counter time the next frame
+            is due
+    """
+
+    def __init__(self, model, stream=None, interactive=None):
+        """
+        Initializes an instance of the TerminalView class
+
+        Parameters:
+            model: An instance of the SnakeGameModel class
+            stream: A text file to write frames to, or None for sys.stdout
+            interactive: A bool of whether to draw frames in place, or None
+                to draw in place only when the stream is a terminal
+        """
+        super().__init__(model)
+        self._stream = sys.stdout if stream is None else stream
+        if interactive is None:
+            interactive = self._stream.isatty()
+        self._interactive = interactive
+        self._lines = None
+        self._next_frame = time.perf_counter()
+
+    def _status(self):
+        """
+        Gets the line shown below the board
+
+        Returns:
+            A string with the score of each snake and, once the game is
+            over, who won
+        """
+        scores = "  ".join(
+            f"Snake {index + 1}: {snake.apples_eaten}"
+            for index, snake in enumerate(self._model.snakes)
+        )
+        if self._model.game_state != 3:
+            return scores
+        winners = self._model.snake_won()
+        if all(winners):
+            return f"{scores}  Tie!"
+        names = " and ".join(
+            f"Snake {index + 1}" for index, won in enumerate(winners) if won
+        )
+        return f"{scores}  {names} won!"
+
+    def _frame_lines(self):
+        """
+        Gets the lines of the current frame
+
+        Returns:
+            A list of strings of each line of the board and the status line
+        """
+        return repr(self._model).splitlines() + [self._status()]
+
+    def _diff(self, lines):
+        """
+        Builds the escape codes and text that change the lines on the
+        terminal into new lines
+
+        Parameters:
+            lines: A list of strings of each line of the new frame
+
+        Returns:
+            A string to write to the terminal
+        """
+        if self._lines is None or len(lines) != len(self._lines):
+            return _CLEAR + "\n".join(lines) + "\n"
+
+        parts = []
+        for row, (old_line, new_line) in enumerate(zip(self._lines, lines)):
+            if old_line == new_line:
+                continue
+            if len(old_line) != len(new_line):
+                parts.append(_MOVE.format(row + 1, 1) + _CLEAR_LINE + new_line)
+                continue
+            for col, (old, new) in enumerate(zip(old_line, new_line)):
+                if old != new:
+                    parts.append(_MOVE.format(row + 1, col + 1) + new)
+        if parts:
+            # Leave the cursor below the frame
+            parts.append(_MOVE.format(len(lines) + 1, 1))
+        return "".join(parts)
+
+    def draw(self, frame_rate, interpolation=None):
+        """
+        Writes the current frame to the stream
+
+        Parameters:
+            frame_rate: An integer representing the most frames to draw per
+                second, or 0 to draw without waiting
+            interpolation: Ignored, as snakes are always drawn in their cells
+        """
+        del interpolation
+        lines = self._frame_lines()
+        if self._interactive:
+            self._stream.write(self._diff(lines))
+        elif lines != self._lines:
+            self._stream.write("\n".join(lines) + "\n\n")
+        self._lines = lines
+        self._stream.flush()
+
+        if frame_rate:
+            now = time.perf_counter()
+            self._next_frame = max(self._next_frame + 1 / frame_rate, now)
+            time.sleep(self._next_frame - now)
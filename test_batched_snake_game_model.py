@@ -0,0 +1,84 @@
+"""
+Test the batched snake game model class
+"""
+
+from unittest.mock import patch
+import numpy as np
+from batched_snake_game_model import BatchedSnakeGameModel
+from snake import DIRECTIONS
+from snake_game_model import SnakeGameModel
+
+
+def test_matches_single_games():
+    """
+    Test that every game in the batch plays exactly like a SnakeGameModel
+    given the same moves and the same apple respawns
+    """
+    # pylint: disable=protected-access
+    num_games = 32
+    rng = np.random.default_rng(5)
+    batch = BatchedSnakeGameModel(
+        num_games, num_apples=1, apples_to_win=3, seed=5
+    )
+    games = [SnakeGameModel(apples_to_win=3) for _ in range(num_games)]
+    finished_games = 0
+
+    for _ in range(300):
+        actions = rng.integers(0, 4, size=(num_games, 2))
+        winners, finished = batch.step(actions)
+        for index, game in enumerate(games):
+            # Respawn any eaten apple where the batch put it
+            cell = int(batch._apples[index, 0])
+            game._random_free_cell = lambda cell=cell: cell
+            game.move_snakes(*(DIRECTIONS[code] for code in actions[index]))
+
+            if finished[index]:
+                finished_games += 1
+                assert tuple(winners[index]) == game.snake_won()
+                game.reset()
+            else:
+                assert game.snake_won() == (False, False)
+            for snake_index, snake in enumerate(game.snakes):
+                assert batch.locations(index, snake_index) == snake.locations
+            assert batch.apples[index].tolist() == game.apples
+            assert batch.apples_eaten[index].tolist() == [
+                snake.apples_eaten for snake in game.snakes
+            ]
+
+    assert batch.games_played == finished_games > 0
+
+
+def test_apples_respawn_on_free_cells():
+    """
+    Test that apples are never on a snake or on each other, on a small
+    board where games last several ticks and many apples are eaten
+    """
+    # pylint: disable=protected-access
+    rng = np.random.default_rng(11)
+    batch = BatchedSnakeGameModel(
+        64, board_width=8, board_height=8, num_apples=6, seed=11
+    )
+    respawned = 0
+    for _ in range(200):
+        with patch.object(
+            batch, "_respawn", wraps=batch._respawn
+        ) as mock_respawn:
+            batch.step(rng.integers(0, 4, size=(64, 2)))
+        respawned += sum(
+            len(call.args[0]) for call in mock_respawn.call_args_list
+        )
+        for index in range(64):
+            apples = [tuple(apple) for apple in batch.apples[index].tolist()]
+            assert len(set(apples)) == 6
+            for snake_index in range(2):
+                for location in batch.locations(index, snake_index):
+                    assert tuple(location) not in apples
+            assert batch._occupancy[index].sum() == sum(
+                1
+                for snake_index in range(2)
+                for row, col in batch.locations(index, snake_index)
+                if 0 <= row < 8 and 0 <= col < 8
+            )
+
+    assert respawned > 1000
+    assert batch.games_played < 64 * 200 // 2
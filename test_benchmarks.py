@@ -0,0 +1,32 @@
+"""
+Tests for the comparison of benchmark results against a baseline
+"""
+
+from benchmarks import CALIBRATION, compare
+
+
+def test_compare_finds_regressions():
+    """
+    Test that only benchmarks slower than the threshold allows are reported,
+    ignoring those missing from either set
+    """
+    baseline = {"fast": 1.0, "slow": 1.0, "gone": 1.0}
+    results = {"fast": 1.2, "slow": 1.3, "new": 5.0}
+    assert compare(results, baseline, 0.25) == [("slow", 1.3, 1.0, 1.3)]
+
+
+def test_compare_scales_by_calibration():
+    """
+    Test that the baseline is scaled by how much faster or slower the
+    calibration ran
+    """
+    baseline = {CALIBRATION: 1.0, "bench": 1.0}
+    results = {CALIBRATION: 2.0, "bench": 2.2}
+    assert not compare(results, baseline, 0.25)
+    results = {CALIBRATION: 0.5, "bench": 1.0}
+    assert compare(results, baseline, 0.25) == [("bench", 1.0, 0.5, 2.0)]
+
+    # Memory does not depend on the speed of the machine
+    baseline = {CALIBRATION: 1.0, "memory_bytes": 10.0}
+    results = {CALIBRATION: 0.5, "memory_bytes": 10.0}
+    assert not compare(results, baseline, 0.25)
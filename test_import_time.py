@@ -0,0 +1,89 @@
+"""
+Tests that the model and the tools built on it start fast, without pygame
+"""
+
+import subprocess
+import sys
+import pytest
+
+# Most seconds importing the model may take. Importing pygame alone takes
+# about 0.2 seconds, so this fails if the model path starts importing it
+MODEL_IMPORT_BUDGET = 0.1
+
+
+def _import_time(module):
+    """
+    Measures how long a module takes to import in a fresh interpreter, as
+    reported by python -X importtime
+
+    Parameters:
+        module: A string of the name of the module
+
+    Returns:
+        float: the fastest of three imports in seconds
+    """
+    times = []
+    for _ in range(3):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # Lines are "import time: self | cumulative | name", in microseconds
+        for line in result.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                times.append(int(fields[1]) / 1e6)
+    return min(times)
+
+
+def _imported_modules(module):
+    """
+    Finds the top level modules imported by importing a module in a fresh
+    interpreter
+
+    Parameters:
+        module: A string of the name of the module
+
+    Returns:
+        set of strings of the names of the modules imported
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "snake_game_model",
+        "snake_game_headless",
+        "snake_game_view",
+        "snake_game_controller",
+        "snake_game_bot_controller",
+        "snake_game_replay",
+        "snake_game_terminal_view",
+        "snake_game_cell_view",
+    ],
+)
+def test_headless_modules_do_not_import_pygame(module):
+    """
+    Test that modules that can run without a window do not import pygame
+    """
+    assert "pygame" not in _imported_modules(module)
+
+
+def test_model_import_budget():
+    """
+    Test that importing the model stays within its time budget
+    """
+    assert _import_time("snake_game_model") < MODEL_IMPORT_BUDGET
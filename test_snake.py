@@ -4,7 +4,7 @@ Test the snake class
 
 # pylint: disable=too-many-arguments
 import pytest
-from snake import Snake
+from snake import DIRECTIONS, Snake
 
 init_cases = [
     # Test snake facing left
@@ -378,3 +378,41 @@ def test_grow(
 
     assert snake_one.locations == output_locations
     assert snake_one.directions == output_directions
+
+
+def test_ends_of_snake():
+    """
+    Test that the head, tail, direction and length match the full body
+    """
+    snake_one = Snake(
+        None,
+        None,
+        None,
+        locations_and_directions=[
+            [[5, 5], [6, 5], [6, 6], [7, 6]],
+            ["UP", "LEFT", "UP", "LEFT"],
+        ],
+    )
+    snake_one.move("RIGHT")
+    snake_one.grow()
+
+    assert snake_one.head == snake_one.locations[0] == [5, 6]
+    assert snake_one.tail == snake_one.locations[-1] == [7, 6]
+    assert snake_one.direction == snake_one.directions[0] == "RIGHT"
+    assert len(snake_one) == len(snake_one.locations) == 5
+
+
+def test_grow_after_moves():
+    """
+    Test that growing after the head has wrapped around the body storage
+    keeps the segments in order, and that moves can use integer codes
+    """
+    snake_one = Snake([5, 5], "RIGHT", 3)
+    snake_one.move("UP")
+    snake_one.grow()
+    snake_one.grow()
+    snake_one.move(DIRECTIONS.index("LEFT"))
+
+    assert snake_one.locations == [[4, 4], [4, 5], [5, 5], [5, 4], [5, 3]]
+    assert snake_one.directions == ["LEFT", "UP", "RIGHT", "RIGHT", "RIGHT"]
+    assert snake_one.apples_eaten == 2
@@ -0,0 +1,60 @@
+"""
+Tests for the cache of game images and fonts
+"""
+
+import os
+from unittest.mock import patch
+import pygame
+from snake_game_assets import IMAGE_FILES, SCORE_FONT, AssetCache
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+def test_images_loaded_once():
+    """
+    Test that each image is loaded from disk once however often it is asked
+    for
+    """
+    pygame.init()
+    pygame.display.set_mode((100, 100))
+    with patch("pygame.image.load", wraps=pygame.image.load) as load:
+        assets = AssetCache()
+        for _ in range(3):
+            for name in IMAGE_FILES:
+                assets.image(name)
+    assert load.call_count == len(IMAGE_FILES)
+
+
+def test_images_converted_to_display_format():
+    """
+    Test that images are converted to the format of the display, keeping
+    transparency where they have it
+    """
+    pygame.init()
+    pygame.display.set_mode((100, 100))
+    assets = AssetCache()
+    assert assets.image("apple").get_flags() & pygame.SRCALPHA
+    display_size = pygame.display.get_surface().get_bitsize()
+    assert assets.image("background").get_bitsize() == display_size
+
+
+def test_font_cached():
+    """
+    Test that a font is opened once for each size
+    """
+    pygame.init()
+    assets = AssetCache({})
+    assert assets.font(SCORE_FONT, 100) is assets.font(SCORE_FONT, 100)
+    assert assets.font(SCORE_FONT, 100) is not assets.font(SCORE_FONT, 50)
+
+
+def test_text_rendered_once():
+    """
+    Test that the same text in the same color is rendered once
+    """
+    pygame.init()
+    assets = AssetCache({})
+    green = assets.text(SCORE_FONT, 100, "3", (0, 255, 0))
+    assert assets.text(SCORE_FONT, 100, "3", (0, 255, 0)) is green
+    assert assets.text(SCORE_FONT, 100, "3", (255, 0, 0)) is not green
+    assert assets.text(SCORE_FONT, 100, "4", (0, 255, 0)) is not green
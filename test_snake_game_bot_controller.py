@@ -0,0 +1,139 @@
+"""
+Test the bots that path find to the apples
+"""
+
+import random
+import time
+import pytest
+from snake_game_bot_controller import BotController, find_move
+from snake_game_headless import load_policy
+from snake_game_model import SnakeGameModel
+
+
+def _pocket_game():
+    """
+    Makes a game where snake two's body leaves a dead end between snake
+    one's head and the apple
+
+    Returns:
+        SnakeGameModel: the game, with snake one's head at [9, 6] facing
+        right into the dead end at [9, 7] and the apple at [9, 9]
+    """
+    return SnakeGameModel(
+        snake_one_locations=[[9, 6], [9, 5], [9, 4]],
+        snake_one_directions=["RIGHT"] * 3,
+        snake_two_locations=[
+            [6, 9],
+            [6, 8],
+            [6, 7],
+            [7, 7],
+            [8, 7],
+            [8, 8],
+            [9, 8],
+            [10, 8],
+            [10, 7],
+        ],
+        snake_two_directions=[
+            "RIGHT",
+            "RIGHT",
+            "UP",
+            "UP",
+            "LEFT",
+            "UP",
+            "UP",
+            "RIGHT",
+            "RIGHT",
+        ],
+    )
+
+
+def test_find_move_toward_apple():
+    """
+    Test that both snakes move along a shortest path to the apple
+    """
+    game = SnakeGameModel()
+    assert game.apples == [[9, 9]]
+    assert find_move(game, 0) in ("RIGHT", "DOWN")
+    assert find_move(game, 1) in ("LEFT", "UP")
+
+
+def test_find_move_around_bodies():
+    """
+    Test that a snake goes around a body instead of into a dead end
+    """
+    game = _pocket_game()
+    assert find_move(game, 0) == "DOWN"
+
+
+def test_find_move_most_room_without_path():
+    """
+    Test that a snake moves toward the most room when no apple can be
+    reached
+    """
+    game = _pocket_game()
+    # An apple under a body can not be reached
+    game.apples[0][:] = [9, 8]
+    assert find_move(game, 0) != "RIGHT"
+
+
+@pytest.mark.timing
+def test_find_move_out_of_time():
+    """
+    Test that a search out of time moves toward the closest cell it found
+    """
+    game = SnakeGameModel(board_width=1000, board_height=1000)
+    game.apples[0][:] = [0, 999]
+    start = time.perf_counter()
+    direction = find_move(game, 0, time_budget=0)
+    # Searching the whole board would take seconds
+    assert time.perf_counter() - start < 0.1
+    assert direction in ("UP", "RIGHT")
+
+
+@pytest.mark.timing
+def test_find_move_many_apples():
+    """
+    Test that searching steps cost the same however many apples there are,
+    so the time budget holds on a board full of apples
+    """
+    random.seed(2)
+    game = SnakeGameModel(
+        board_width=1000, board_height=1000, num_apples=200000
+    )
+    start = time.perf_counter()
+    direction = find_move(game, 0, time_budget=0)
+    # Finding the nearest apple takes about 0.08 seconds, and measuring
+    # each cell searched against every apple about 0.3 seconds
+    assert time.perf_counter() - start < 0.2
+    assert direction in ("UP", "DOWN", "RIGHT")
+
+
+def test_bot_drives_chosen_players():
+    """
+    Test that a bot only moves the snakes it drives
+    """
+    game = SnakeGameModel()
+    bot = BotController(game, players=[1])
+    bot.move()
+    assert game.snake_one.direction == "RIGHT"
+    assert game.snake_two.direction in ("LEFT", "UP")
+    assert bot.move_stats()["moves"] == 1
+
+
+@pytest.mark.timing
+def test_bots_play_a_game():
+    """
+    Test that bots eat apples and choose moves within the time budget
+    """
+    random.seed(5)
+    game = SnakeGameModel()
+    bot = BotController(game)
+    for _ in range(2000):
+        bot.move()
+        if True in game.snake_won():
+            break
+    assert game.snake_one.apples_eaten + game.snake_two.apples_eaten >= 5
+    # Moves take about 60 microseconds, so this only fails if the budget
+    # is not kept
+    assert bot.move_stats()["mean_time"] < 0.005
+    assert load_policy("bot") is find_move
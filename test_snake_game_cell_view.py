@@ -0,0 +1,46 @@
+"""
+Tests for drawing the game as one pixel per cell
+"""
+
+import numpy as np
+from snake_game_cell_view import (
+    APPLE_COLOR,
+    EMPTY_COLOR,
+    SNAKE_COLORS,
+    CellView,
+)
+from snake_game_model import SnakeGameModel
+
+
+def test_cell_view():
+    """
+    Test that each cell is drawn as one pixel in the color of what is on it,
+    leaving out heads that have left the board
+    """
+    game = SnakeGameModel(
+        snake_one_locations=[[2, 4], [2, 3], [2, 2]],
+        snake_one_directions=["RIGHT", "RIGHT", "RIGHT"],
+        snake_two_locations=[[12, 4], [12, 3], [12, 2]],
+        snake_two_directions=["RIGHT", "RIGHT", "RIGHT"],
+        board_width=15,
+        board_height=17,
+    )
+    view = CellView(game)
+    view.draw()
+    frame = view.frame
+    assert frame.shape == (17, 15, 3)
+    assert tuple(frame[2, 4]) == SNAKE_COLORS[0][1]
+    assert tuple(frame[2, 2]) == SNAKE_COLORS[0][0]
+    assert tuple(frame[12, 4]) == SNAKE_COLORS[1][1]
+    assert tuple(frame[12, 3]) == SNAKE_COLORS[1][0]
+    row, col = game.apples[0]
+    assert tuple(frame[row, col]) == APPLE_COLOR
+    assert (frame == EMPTY_COLOR).all(axis=2).sum() == 15 * 17 - 7
+
+    # Heads off the board are left out
+    for _ in range(12):
+        game.move_snakes("RIGHT", "RIGHT")
+    view.draw()
+    head_color = np.array(SNAKE_COLORS[0][1], dtype=np.uint8)
+    assert not (frame == head_color).all(axis=2).any()
+    assert tuple(frame[2, 14]) == SNAKE_COLORS[0][0]
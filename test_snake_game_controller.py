@@ -8,7 +8,7 @@ from unittest.mock import Mock, patch
 import pytest
 import pygame
 
-from snake_game_controller import GraphicalController
+from snake_game_graphical_controller import GraphicalController
 
 
 @pytest.fixture(autouse=True)
@@ -64,13 +64,15 @@ def test_reset(controller):
         controller fixture from pytest with a mocked model.
     """
     ctrl, _ = controller
+    ctrl._queue_move(0, "UP", 0.0)
+    ctrl.move()
+    ctrl._queue_move(1, "UP", 0.0)
     ctrl.reset()
-    assert ctrl._player_one_cue == [
-        "RIGHT"
-    ], "Player one cue should be reset to ['RIGHT']"
-    assert ctrl._player_two_cue == [
-        "LEFT"
-    ], "Player two cue should be reset to ['LEFT']"
+    assert ctrl._player_directions == [
+        "RIGHT",
+        "LEFT",
+    ], "Directions should be reset to ['RIGHT', 'LEFT']"
+    assert not any(ctrl._player_queues), "Move queues should be cleared"
     assert ctrl.events == [], "Events should be cleared"
 
 
@@ -91,10 +93,9 @@ def test_fetch_events(controller):
     ctrl.fetch_events()
 
     assert mock_pygame_event_get.called, "pygame.event.get should be called"
-    assert ctrl._player_one_cue == [
-        "RIGHT",
-        "UP",
-    ], "Player one cue should contain 'UP'"
+    assert [move for move, _ in ctrl._player_queues[0]] == [
+        "UP"
+    ], "Player one queue should contain 'UP'"
 
 
 def test_move(controller, mock_model):
@@ -108,16 +109,21 @@ def test_move(controller, mock_model):
         mock_model (Mock): The mocked game model used for testing.
     """
     ctrl, _ = controller
-    ctrl._player_one_cue = ["RIGHT", "UP", "DOWN"]
-    ctrl._player_two_cue = ["LEFT", "DOWN", "UP"]
+    for direction in ("UP", "LEFT"):
+        ctrl._queue_move(0, direction, 0.0)
+    for direction in ("DOWN", "RIGHT"):
+        ctrl._queue_move(1, direction, 0.0)
     ctrl.move()
 
     # Check if model.move_snakes is called with the right parameters
     mock_model.move_snakes.assert_called_with("UP", "DOWN")
-    assert ctrl._player_one_cue == [
-        "DOWN"
-    ], "Player one cue should be processed"
-    assert ctrl._player_two_cue == ["UP"], "Player two cue should be processed"
+    ctrl.move()
+    mock_model.move_snakes.assert_called_with("LEFT", "RIGHT")
+
+    # With nothing queued the snakes keep going the same way
+    ctrl.move()
+    mock_model.move_snakes.assert_called_with("LEFT", "RIGHT")
+    assert not any(ctrl._player_queues), "Move queues should be processed"
 
 
 def test_process_events_game_state_changes(controller, mock_model):
@@ -139,3 +145,133 @@ def test_process_events_game_state_changes(controller, mock_model):
 
     # Check if game state is set correctly upon pressing space
     mock_model.set_game_state.assert_called_with(2)
+
+
+def test_queue_filters_and_drops(controller):
+    """
+    Test that repeated and reversing moves are filtered out and that moves
+    beyond the queue size are dropped and counted.
+
+    Parameters:
+        controller (Fixture[Tuple[GraphicalController, MagicMock]]): The
+        controller fixture from pytest with a mocked model.
+    """
+    ctrl, _ = controller
+    # Player one starts moving right
+    for direction in ("RIGHT", "LEFT", "UP", "UP", "DOWN", "LEFT", "DOWN"):
+        ctrl._queue_move(0, direction, 0.0)
+    ctrl._queue_move(0, "RIGHT", 0.0)
+
+    assert [move for move, _ in ctrl._player_queues[0]] == [
+        "UP",
+        "LEFT",
+        "DOWN",
+    ]
+    stats = ctrl.input_stats()[0]
+    assert stats["queued"] == 3
+    assert stats["filtered"] == 4
+    assert stats["dropped"] == 1
+    assert ctrl.input_stats()[1]["queued"] == 0
+
+
+def test_input_latency(controller):
+    """
+    Test that the time from a key press to its move is measured.
+
+    Parameters:
+        controller (Fixture[Tuple[GraphicalController, MagicMock]]): The
+        controller fixture from pytest with a mocked model.
+    """
+    ctrl, _ = controller
+    with patch("time.perf_counter", return_value=10.0):
+        ctrl._queue_move(0, "UP", 9.5)
+        ctrl._queue_move(0, "LEFT", 9.9)
+        ctrl.move()
+        ctrl.move()
+        ctrl.move()
+
+    stats = ctrl.input_stats()[0]
+    assert stats["applied"] == 2
+    assert stats["mean_latency"] == pytest.approx(0.3)
+    assert stats["max_latency"] == pytest.approx(0.5)
+
+
+def test_wait_for_events(controller, mock_model):
+    """
+    Test that waiting for events processes the event that ends the wait and
+    any that arrived with it, and nothing if the wait times out.
+
+    Parameters:
+        controller (Fixture[Tuple[GraphicalController, MagicMock]]): The
+        controller fixture from pytest with a mocked model.
+        mock_model (Mock): The mocked game model used for testing.
+    """
+    ctrl, mock_pygame_event_get = controller
+    mock_model.game_state = 3
+    mock_pygame_event_get.return_value = []
+    with patch(
+        "pygame.event.wait", return_value=Mock(type=pygame.NOEVENT)
+    ) as mock_wait:
+        ctrl.wait_for_events(1000)
+    mock_wait.assert_called_with(1000)
+    assert ctrl.events == []
+    mock_model.reset.assert_not_called()
+
+    mock_event_space = Mock(type=pygame.KEYDOWN, key=pygame.K_SPACE)
+    with patch("pygame.event.wait", return_value=mock_event_space):
+        ctrl.wait_for_events(1000)
+    mock_model.reset.assert_called_once()
+    mock_model.set_game_state.assert_called_with(2)
+
+
+def test_exposed_window_is_repainted(controller, mock_model):
+    """
+    Test that the window is updated from the screen when it is exposed
+    while a start or end screen waits for input, as the view leaves a
+    screen it has drawn alone.
+
+    Parameters:
+        controller (Fixture[Tuple[GraphicalController, MagicMock]]): The
+        controller fixture from pytest with a mocked model.
+        mock_model (Mock): The mocked game model used for testing.
+    """
+    ctrl, mock_pygame_event_get = controller
+    mock_model.game_state = 1
+    mock_pygame_event_get.return_value = [Mock(type=pygame.VIDEOEXPOSE)]
+    with patch(
+        "pygame.event.wait", return_value=Mock(type=pygame.WINDOWEXPOSED)
+    ), patch("pygame.display.update") as mock_update:
+        ctrl.wait_for_events(1000)
+    assert mock_update.call_count == 2
+    mock_model.set_game_state.assert_not_called()
+
+
+def test_sample_events(controller):
+    """
+    Test that sampling events waits on the event queue until the deadline,
+    queuing moves as they arrive.
+
+    Parameters:
+        controller (Fixture[Tuple[GraphicalController, MagicMock]]): The
+        controller fixture from pytest with a mocked model.
+    """
+    ctrl, mock_pygame_event_get = controller
+    mock_pygame_event_get.return_value = []
+    events = [
+        Mock(type=pygame.KEYDOWN, key=pygame.K_w),
+        Mock(type=pygame.NOEVENT),
+        Mock(type=pygame.KEYDOWN, key=pygame.K_DOWN),
+    ]
+    times = iter([0.0, 0.0, 0.004, 0.004, 0.008, 0.008, 0.0101])
+    with patch("pygame.event.wait", side_effect=events) as mock_wait, patch(
+        "time.perf_counter", side_effect=lambda: next(times)
+    ):
+        ctrl.sample_events(0.01)
+
+    assert [call.args for call in mock_wait.call_args_list] == [
+        (10,),
+        (6,),
+        (2,),
+    ]
+    assert list(ctrl._player_queues[0]) == [("UP", 0.0)]
+    assert list(ctrl._player_queues[1]) == [("DOWN", 0.008)]
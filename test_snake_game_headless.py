@@ -0,0 +1,67 @@
+"""
+Test the headless game runner
+"""
+
+import random
+import pytest
+from snake_game_headless import load_policy, main, run_games
+
+
+def test_run_games_counts_every_game():
+    """
+    Test that every game is counted as a win, a tie or stopped
+    """
+    random.seed(4)
+    policies = [load_policy("greedy"), load_policy("random")]
+    stats = run_games(policies, 30, max_ticks=200)
+
+    assert stats["games"] == 30
+    assert sum(stats["wins"]) + stats["ties"] + stats["stopped"] == 30
+    assert 30 <= stats["ticks"] <= 30 * 200
+    assert stats["ticks_per_second"] > 0
+
+
+def test_straight_snakes_hit_the_wall():
+    """
+    Test that two snakes going straight both reach a wall on the same tick
+    """
+    stats = run_games([load_policy("straight")] * 2, 3)
+
+    assert stats["ties"] == 3
+    assert stats["mean_ticks_per_game"] == 15
+
+
+def test_greedy_snakes_play_without_apples():
+    """
+    Test that greedy snakes still move when the board has no apples
+    """
+    random.seed(6)
+    stats = run_games(
+        [load_policy("greedy")] * 2, 3, max_ticks=50, num_apples=0
+    )
+
+    assert stats["games"] == 3
+    assert stats["ticks"] > 0
+
+
+def test_load_policy_from_module():
+    """
+    Test that policies can be loaded as module:function and that unknown
+    names are rejected
+    """
+    assert load_policy("snake_game_headless:random_policy") is load_policy(
+        "random"
+    )
+    with pytest.raises(ValueError):
+        load_policy("sideways")
+
+
+def test_main_prints_stats(capsys):
+    """
+    Test that the command line prints the statistics
+    """
+    main(["--games", "5", "--policy", "random", "--policy", "random"])
+
+    output = capsys.readouterr().out
+    assert "games:          5" in output
+    assert "ticks/second:" in output
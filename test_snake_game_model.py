@@ -3,6 +3,7 @@ Test snake game model class
 """
 
 # pylint: disable=too-many-arguments
+import random
 import pytest
 from snake_game_model import SnakeGameModel
 
@@ -361,3 +362,238 @@ def test_snake_won_from_length():
 
     assert snake_one
     assert not snake_two
+
+
+def test_snake_collision_after_moves():
+    """
+    Test that the occupancy based collision check snake_won relies on
+    matches checking each head against the walls and every segment of both
+    snakes
+    """
+    # pylint: disable=protected-access
+    rng = random.Random(7)
+    for _ in range(50):
+        game = SnakeGameModel()
+        for _ in range(30):
+            game.move_snakes(
+                rng.choice(["UP", "DOWN", "LEFT", "RIGHT"]),
+                rng.choice(["UP", "DOWN", "LEFT", "RIGHT"]),
+            )
+            snake_one = game.snake_one.locations
+            snake_two = game.snake_two.locations
+            expected = tuple(
+                not (0 <= head[0] < 19 and 0 <= head[1] < 19) or head in others
+                for head, others in (
+                    (snake_one[0], snake_one[1:] + snake_two),
+                    (snake_two[0], snake_two[1:] + snake_one),
+                )
+            )
+            collisions, winners = game._compute_outcome()
+            assert collisions == expected
+            assert game.snake_won() == winners
+            if True in collisions:
+                break
+
+
+def test_new_apple_on_free_cell():
+    """
+    Test that eaten apples respawn away from both snakes and that the free
+    cell index matches the cells with no snake or apple on them
+    """
+    # pylint: disable=protected-access
+    random.seed(3)
+    for _ in range(20):
+        game = SnakeGameModel(
+            snake_one_locations=[[9, 8], [9, 7], [9, 6]],
+            snake_one_directions=["RIGHT", "RIGHT", "RIGHT"],
+        )
+        game.move_snakes("RIGHT", "LEFT")
+
+        snake_cells = game.snake_one.locations + game.snake_two.locations
+        assert game.snake_one.apples_eaten == 1
+        assert game.apples[0] not in snake_cells
+        assert sorted(game._free_cells) == [
+            row * game.board_width + col
+            for row in range(game.board_height)
+            for col in range(game.board_width)
+            if [row, col] not in snake_cells + game.apples
+        ]
+
+
+def test_seed_repeats_apples():
+    """
+    Test that a match seeded the same places the same apples, and that each
+    reset starts a newly seeded match
+    """
+
+    def apple_locations(game):
+        """
+        Moves snake one right five times, collecting where the apple is
+        """
+        apples = []
+        for direction in ["RIGHT"] * 5:
+            game.move_snakes(direction, "UP")
+            apples.append(list(game.apples[0]))
+        return apples
+
+    first = SnakeGameModel(
+        snake_one_locations=[[9, 8], [9, 7], [9, 6]],
+        snake_one_directions=["RIGHT", "RIGHT", "RIGHT"],
+        seed=21,
+    )
+    second = SnakeGameModel(
+        snake_one_locations=[[9, 8], [9, 7], [9, 6]],
+        snake_one_directions=["RIGHT", "RIGHT", "RIGHT"],
+        seed=21,
+    )
+    assert first.seed == second.seed == 21
+    assert apple_locations(first) == apple_locations(second)
+
+    random.seed(4)
+    first.reset()
+    random.seed(4)
+    second.reset()
+    assert first.seed == second.seed != 21
+    second.reset(seed=first.seed)
+    assert second.seed == first.seed
+
+
+def test_seed_out_of_range():
+    """
+    Test that seeds a replay can not store are rejected
+    """
+    for seed in (-5, 1 << 64):
+        with pytest.raises(ValueError):
+            SnakeGameModel(seed=seed)
+        with pytest.raises(ValueError):
+            SnakeGameModel().reset(seed=seed)
+    assert SnakeGameModel(seed=(1 << 64) - 1).seed == (1 << 64) - 1
+
+
+def test_move_log():
+    """
+    Test that the direction given to each snake on each tick is logged, and
+    that resetting starts a new log
+    """
+    game = SnakeGameModel()
+    assert game.move_log == b""
+    game.move_snakes("RIGHT", "LEFT")
+    game.move_snakes("DOWN", "UP")
+    assert game.move_log == bytes([3, 2, 1, 0])
+    game.reset()
+    assert game.move_log == b""
+
+
+def test_snake_won_after_move_and_reset():
+    """
+    Test that the winner is updated by moving and cleared by resetting
+    """
+    game = SnakeGameModel(
+        snake_one_locations=[[0, 5], [1, 5], [2, 5]],
+        snake_one_directions=["UP", "UP", "UP"],
+    )
+    assert game.snake_won() == (False, False)
+
+    game.move_snakes("UP", "LEFT")
+    assert game.snake_won() == (False, True)
+    assert game.snake_won() == (False, True)
+    assert game.game_state == 3
+
+    game.reset()
+    assert game.snake_won() == (False, False)
+
+
+def test_custom_board():
+    """
+    Test that the board size, snake length, apples and win threshold can be
+    set for each game
+    """
+    game = SnakeGameModel(
+        board_width=30,
+        board_height=25,
+        snake_starting_length=6,
+        num_apples=40,
+        apples_to_win=3,
+    )
+    snake_cells = game.snake_one.locations + game.snake_two.locations
+
+    assert (game.board_width, game.board_height) == (30, 25)
+    assert len(game.snake_one.locations) == len(game.snake_two.locations) == 6
+    assert len(game.apples) == game.num_apples == 40
+    assert len({tuple(apple) for apple in game.apples}) == 40
+    assert not any(apple in snake_cells for apple in game.apples)
+    assert len(repr(game).splitlines()) == 27
+    assert all(len(line) == 32 for line in repr(game).splitlines())
+
+    game.snake_one._apples_eaten = 3  # pylint: disable=protected-access
+    assert game.snake_won() == (True, False)
+
+
+def test_small_board_starts_on_board():
+    """
+    Test that snakes on a narrow board start inside it, and that boards too
+    small for the snakes are rejected
+    """
+    game = SnakeGameModel(board_width=8, board_height=8)
+    assert game.snake_one.locations == [[3, 3], [3, 2], [3, 1], [3, 0]]
+    assert game.snake_two.locations == [[5, 4], [5, 5], [5, 6], [5, 7]]
+    assert game.snake_won() == (False, False)
+
+    game = SnakeGameModel(board_width=8, board_height=7, num_snakes=4)
+    assert all(
+        0 <= row < 7 and 0 <= col < 8
+        for snake in game.snakes
+        for row, col in snake.locations
+    )
+    assert [snake.head[0] for snake in game.snakes] == [0, 2, 4, 6]
+
+    with pytest.raises(ValueError):
+        SnakeGameModel(board_width=3, board_height=8)
+    with pytest.raises(ValueError):
+        SnakeGameModel(board_height=7, num_snakes=5)
+
+
+def test_four_snakes():
+    """
+    Test that more than two snakes start apart, move together and that only
+    the snakes that collide lose
+    """
+    game = SnakeGameModel(num_snakes=4)
+
+    assert game.num_snakes == len(game.snakes) == 4
+    assert [snake.head for snake in game.snakes] == [
+        [6, 4],
+        [8, 14],
+        [10, 4],
+        [12, 14],
+    ]
+    assert game.snake_won() == (False, False, False, False)
+
+    game.move_snakes("RIGHT", "LEFT", "RIGHT", "LEFT")
+    assert [snake.head for snake in game.snakes] == [
+        [6, 5],
+        [8, 13],
+        [10, 5],
+        [12, 13],
+    ]
+
+    with pytest.raises(ValueError):
+        game.move_snakes("RIGHT", "LEFT")
+
+
+def test_head_to_head_with_more_snakes():
+    """
+    Test that snakes whose heads meet both die and the others win
+    """
+    game = SnakeGameModel(
+        snake_bodies=[
+            None,
+            None,
+            [[[3, 4], [3, 3], [3, 2]], ["RIGHT", "RIGHT", "RIGHT"]],
+            [[[3, 6], [3, 7], [3, 8]], ["LEFT", "LEFT", "LEFT"]],
+        ]
+    )
+    game.move_snakes("RIGHT", "LEFT", "RIGHT", "LEFT")
+
+    assert game.snake_won() == (True, True, False, False)
+    assert game.game_state == 3
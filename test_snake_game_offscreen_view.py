@@ -0,0 +1,51 @@
+"""
+Tests for drawing the game into memory
+"""
+
+# pylint: disable=protected-access
+
+import os
+import pygame
+from snake_game_model import SnakeGameModel
+from snake_game_offscreen_view import OffscreenView
+from snake_game_graphical_view import GraphicalView
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+def test_offscreen_frame_matches_window():
+    """
+    Test that a frame drawn into memory is the frame the window shows
+    """
+    game = SnakeGameModel()
+    game.set_game_state(2)
+    window = GraphicalView(game, 1400, 1050)
+    window.draw(0)
+    expected = pygame.image.tobytes(window._screen, "RGB")
+
+    game.reset()
+    view = OffscreenView(game, 1400, 1050)
+    view.draw()
+    frame = view.frame
+    assert frame.shape == (1050, 1400, 3)
+    assert frame.tobytes() == expected
+
+
+def test_offscreen_without_display():
+    """
+    Test that drawing into memory opens no window, and that the frame is a
+    view of the surface drawn on
+    """
+    pygame.display.quit()
+    game = SnakeGameModel()
+    game.set_game_state(2)
+    view = OffscreenView(game, 700, 525)
+    view.draw()
+    assert pygame.display.get_surface() is None
+
+    # The frame is a view of the surface, not a copy
+    frame = view.frame
+    frame[0, 0] = (9, 8, 7)
+    del frame
+    assert tuple(view.surface.get_at((0, 0)))[:3] == (9, 8, 7)
+    view.draw()
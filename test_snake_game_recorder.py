@@ -0,0 +1,88 @@
+"""
+Tests for recording frames on a background thread
+"""
+
+import os
+import pygame
+from snake_game_model import SnakeGameModel
+from snake_game_offscreen_view import OffscreenView
+from snake_game_recorder import FrameRecorder, read_frames
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+def test_recorded_frames_match_drawn_frames(tmp_path):
+    """
+    Test that a recording holds exactly the frames the view drew
+    """
+    path = tmp_path / "match.rec"
+    game = SnakeGameModel()
+    game.set_game_state(2)
+    with FrameRecorder(path, block=True, frame_rate=None) as recorder:
+        view = OffscreenView(game, 280, 210, recorder)
+        drawn = []
+        for _ in range(5):
+            view.draw()
+            drawn.append(pygame.image.tobytes(view.surface, "RGB"))
+            game.move_snakes("UP", "DOWN")
+
+    frames = list(read_frames(path))
+    assert [size for size, _ in frames] == [(280, 210)] * 5
+    assert [pixels for _, pixels in frames] == drawn
+    stats = recorder.stats()
+    assert stats["captured"] == stats["written"] == 5
+    assert stats["dropped"] == 0
+    assert stats["frames_per_second"] > 0
+
+
+def test_full_queue_drops_frames(tmp_path):
+    """
+    Test that frames captured while the queue is full are dropped and
+    counted, and every queued frame is written
+    """
+    recorder = FrameRecorder(
+        tmp_path / "match.rec", max_queued_frames=1, frame_rate=None
+    )
+    surface = pygame.Surface((400, 300))
+    for _ in range(20):
+        recorder.capture(surface)
+    recorder.close()
+    stats = recorder.stats()
+    assert stats["dropped"] > 0
+    assert stats["captured"] + stats["dropped"] == 20
+    assert stats["written"] == stats["captured"]
+    assert len(list(read_frames(tmp_path / "match.rec"))) == stats["written"]
+
+
+def test_frame_rate_skips_frames(tmp_path):
+    """
+    Test that frames captured faster than the frame rate are skipped
+    """
+    with FrameRecorder(tmp_path / "match.rec", frame_rate=1) as recorder:
+        surface = pygame.Surface((10, 10))
+        for _ in range(10):
+            recorder.capture(surface)
+    assert recorder.stats()["captured"] == 1
+
+
+def test_resized_frames_scaled_to_recording(tmp_path):
+    """
+    Test that frames captured after the window is resized are scaled to the
+    size of the first frame
+    """
+    path = tmp_path / "match.rec"
+    game = SnakeGameModel()
+    game.set_game_state(2)
+    with FrameRecorder(path, block=True, frame_rate=None) as recorder:
+        view = OffscreenView(game, 280, 210, recorder)
+        view.draw()
+        first = pygame.image.tobytes(view.surface, "RGB")
+        recorder.capture(pygame.transform.smoothscale(view.surface, (560, 420)))
+        recorder.capture(pygame.Surface((100, 300)))
+
+    frames = list(read_frames(path))
+    assert [size for size, _ in frames] == [(280, 210)] * 3
+    assert [len(pixels) for _, pixels in frames] == [280 * 210 * 3] * 3
+    assert frames[0][1] == first
+    assert frames[1][1] != first
+    assert recorder.stats()["written"] == 3
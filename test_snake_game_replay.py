@@ -0,0 +1,131 @@
+"""
+Test recording matches and replaying them
+"""
+
+import os
+import random
+import pygame
+import pytest
+from snake_game_bot_controller import BotController
+from snake_game_graphical_view import GraphicalView
+from snake_game_model import SnakeGameModel
+from snake_game_offscreen_view import OffscreenView
+from snake_game_replay import (
+    Replay,
+    handle_window_events,
+    replay_match,
+    state_digest,
+)
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+def _bot_match(**options):
+    """
+    Plays a match between two bots
+
+    Parameters:
+        options: Keyword arguments passed on to SnakeGameModel
+
+    Returns:
+        SnakeGameModel: the game at the end of the match
+    """
+    game = SnakeGameModel(**options)
+    bot = BotController(game)
+    for _ in range(2000):
+        bot.move()
+        if True in game.snake_won():
+            break
+    return game
+
+
+def test_replay_ends_identically(tmp_path):
+    """
+    Test that a saved match replays to exactly the state it ended in, from
+    a file of two bits per move
+    """
+    random.seed(11)
+    game = _bot_match(num_apples=3, apples_to_win=5)
+    path = tmp_path / "match.snakelog"
+    Replay.from_model(game).save(path)
+
+    replay = Replay.load(path)
+    assert replay.ticks == len(game.move_log) // 2
+    assert replay.options["num_apples"] == 3
+    assert os.path.getsize(path) < 100 + replay.ticks // 2
+
+    # The global random module plays no part in the replay
+    random.seed(12)
+    replayed = replay_match(replay)
+    assert state_digest(replayed) == state_digest(game)
+    assert replayed.apples == game.apples
+    assert replayed.move_log == game.move_log
+    assert replayed.game_state == 3
+
+
+def test_replay_detects_changes():
+    """
+    Test that a replay whose moves were changed does not pass the check
+    """
+    random.seed(13)
+    game = _bot_match()
+    replay = Replay.from_model(game)
+    moves = bytearray(replay.moves)
+    moves[-4] ^= 2
+    changed = Replay(replay.options, replay.seed, moves, replay.digest)
+    with pytest.raises(ValueError):
+        replay_match(changed)
+
+
+def test_replay_rejects_custom_starts():
+    """
+    Test that a match whose snakes were given starting bodies cannot be
+    recorded, since a replay only rebuilds the default starting positions
+    """
+    game = SnakeGameModel(
+        snake_bodies=[None, [[[4, 4], [4, 3]], ["RIGHT", "RIGHT"]]]
+    )
+    assert not game.default_start
+    with pytest.raises(ValueError):
+        Replay.from_model(game)
+    game.reset()
+    assert game.default_start
+    assert Replay.from_model(game).ticks == 0
+
+
+def test_replay_through_view():
+    """
+    Test that a replay drawn with a view ends the same and draws the end
+    screen
+    """
+    random.seed(14)
+    replay = Replay.from_model(_bot_match())
+    model = replay.new_model()
+    view = OffscreenView(model, 420, 420)
+    replay_match(replay, model, view)
+    assert model.game_state == 3
+
+
+def test_closing_replay_window_quits():
+    """
+    Test that a replay drawn in a window reads its events and quits when the
+    window is closed
+    """
+    random.seed(15)
+    replay = Replay.from_model(_bot_match())
+    model = replay.new_model()
+    view = GraphicalView(model, 420, 420)
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    with pytest.raises(SystemExit):
+        replay_match(replay, model, view, handle_events=handle_window_events)
+    assert not model.move_log
+
+
+def test_load_rejects_other_files(tmp_path):
+    """
+    Test that loading a file that is not a replay fails
+    """
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a replay")
+    with pytest.raises(ValueError):
+        Replay.load(path)
@@ -0,0 +1,99 @@
+"""
+Tests for viewing the game as text in a terminal
+"""
+
+# pylint: disable=protected-access
+
+import io
+import re
+from snake_game_model import SnakeGameModel
+from snake_game_terminal_view import TerminalView
+
+# Escape codes written by TerminalView
+_ESCAPE = re.compile(r"\x1b\[(?:2J|2K|H|(\d+);(\d+)H)")
+
+
+def _apply(screen, text):
+    """
+    Applies text written to a terminal to a list of lists of characters,
+    understanding the escape codes TerminalView writes
+
+    Parameters:
+        screen: A list of lists of characters on the terminal
+        text: A string written to the terminal
+    """
+    row, col = 0, 0
+    position = 0
+    while position < len(text):
+        match = _ESCAPE.match(text, position)
+        if match:
+            code = match.group(0)
+            if code == "\x1b[2J":
+                screen[:] = [[] for _ in screen]
+            elif code == "\x1b[2K":
+                screen[row] = []
+            elif code == "\x1b[H":
+                row, col = 0, 0
+            else:
+                row, col = int(match.group(1)) - 1, int(match.group(2)) - 1
+            position = match.end()
+            continue
+        character = text[position]
+        if character == "\n":
+            row, col = row + 1, 0
+        else:
+            line = screen[row]
+            line.extend(" " * (col + 1 - len(line)))
+            line[col] = character
+            col += 1
+        position += 1
+
+
+def test_log_frames():
+    """
+    Test that logging writes each frame once, only when something changed
+    """
+    game = SnakeGameModel()
+    stream = io.StringIO()
+    view = TerminalView(game, stream)
+    view.draw(0)
+    view.draw(0)
+    assert stream.getvalue() == repr(game) + "Snake 1: 0  Snake 2: 0\n\n"
+
+    game.set_game_state(2)
+    game.move_snakes("UP", "DOWN")
+    view.draw(0)
+    assert stream.getvalue().count("Snake 1: 0") == 2
+
+
+def test_interactive_diffs():
+    """
+    Test that an interactive terminal is only sent the characters that
+    changed, and ends up showing the whole frame
+    """
+    game = SnakeGameModel(apples_to_win=2)
+    stream = io.StringIO()
+    view = TerminalView(game, stream, interactive=True)
+    screen = [[] for _ in range(game.board_height + 4)]
+    view.draw(0)
+    _apply(screen, stream.getvalue())
+
+    moves = ["RIGHT", "DOWN", "DOWN", "LEFT", "LEFT", "LEFT", "UP", "UP"]
+    for move in moves * 4:
+        stream.seek(0)
+        stream.truncate()
+        game.move_snakes(move, move)
+        game.snake_won()
+        view.draw(0)
+        written = stream.getvalue()
+        assert "\x1b[2J" not in written
+        # Only the few changed characters are written
+        assert len(written) < 200
+        _apply(screen, written)
+        expected = (repr(game) + view._status()).splitlines()
+        assert ["".join(line) for line in screen[: len(expected)]] == expected
+        if game.game_state == 3:
+            break
+    assert game.game_state == 3
+    status = "".join(screen[game.board_height + 2])
+    assert "won!" in status or "Tie!" in status
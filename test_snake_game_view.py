@@ -0,0 +1,241 @@
+"""
+Tests for drawing the game with pygame
+"""
+
+# pylint: disable=protected-access
+
+import copy
+import os
+import random
+from unittest.mock import patch
+import pygame
+from snake_game_headless import greedy_policy
+from snake_game_model import SnakeGameModel
+from snake_game_graphical_view import GraphicalView
+from snake_game_offscreen_view import OffscreenView
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+def _full_frame(view):
+    """
+    Draws the running game from scratch onto a separate surface, leaving
+    what the view remembers of its last frame as it was
+
+    Parameters:
+        view: An instance of the GraphicalView class
+
+    Returns:
+        bytes of the pixels of the frame
+    """
+    state = copy.deepcopy(
+        {
+            name: getattr(view, name)
+            for name in (
+                "_drawn_scores",
+                "_drawn_cells",
+                "_snake_ends",
+                "_ends_tick",
+                "_motion_cells",
+            )
+        }
+    )
+    screen = view._screen
+    view._screen = screen.copy()
+    view._draw_running_game()
+    frame = pygame.image.tobytes(view._screen, "RGB")
+    view._screen = screen
+    for name, value in state.items():
+        setattr(view, name, value)
+    return frame
+
+
+def test_incremental_frames_match_full_redraws():
+    """
+    Test that redrawing only the changed cells of each tick draws the same
+    frame as redrawing everything
+    """
+    random.seed(3)
+    game = SnakeGameModel()
+    view = GraphicalView(game, 1400, 1050)
+    game.set_game_state(2)
+    view.draw(0)
+    for _ in range(300):
+        game.move_snakes(greedy_policy(game, 0), greedy_policy(game, 1))
+        if True in game.snake_won():
+            break
+        game.set_game_state(2)
+        view.draw(0)
+        assert pygame.image.tobytes(view._screen, "RGB") == _full_frame(view)
+    assert game.snake_one.apples_eaten + game.snake_two.apples_eaten > 0
+
+
+def test_reset_redraws_everything():
+    """
+    Test that the first frame after a reset matches a full redraw
+    """
+    game = SnakeGameModel()
+    view = GraphicalView(game, 1400, 1050)
+    game.set_game_state(2)
+    view.draw(0)
+    for _ in range(3):
+        game.move_snakes("UP", "DOWN")
+    game.reset()
+    view.draw(0)
+    assert pygame.image.tobytes(view._screen, "RGB") == _full_frame(view)
+
+
+def test_two_views_of_one_model():
+    """
+    Test that two views drawing the same model each redraw every cell that
+    changed since they last drew it
+    """
+    random.seed(7)
+    game = SnakeGameModel()
+    window = GraphicalView(game, 1400, 1050)
+    offscreen = OffscreenView(game, 1400, 1050)
+    game.set_game_state(2)
+    window.draw(0)
+    offscreen.draw()
+    for _ in range(30):
+        game.move_snakes(greedy_policy(game, 0), greedy_policy(game, 1))
+        if True in game.snake_won():
+            break
+        game.set_game_state(2)
+        window.draw(0)
+        offscreen.draw()
+        frame = pygame.image.tobytes(window._screen, "RGB")
+        assert frame == _full_frame(window)
+        assert pygame.image.tobytes(offscreen.surface, "RGB") == frame
+
+
+def test_interpolated_frames():
+    """
+    Test that snakes drawn part way through a move are covered up again,
+    leaving frames that match a full redraw once they reach their cells
+    """
+    random.seed(5)
+    game = SnakeGameModel()
+    view = GraphicalView(game, 1400, 1050)
+    game.set_game_state(2)
+    view.draw(0, 0.0)
+    for _ in range(40):
+        game.move_snakes(greedy_policy(game, 0), greedy_policy(game, 1))
+        if True in game.snake_won():
+            break
+        game.set_game_state(2)
+        view.draw(0, 0.0)
+        start = pygame.image.tobytes(view._screen, "RGB")
+        view.draw(0, 0.5)
+        assert pygame.image.tobytes(view._screen, "RGB") != start
+
+        # At the end of the move the snakes are back in their cells
+        view.draw(0, 1.0)
+        assert pygame.image.tobytes(view._screen, "RGB") == _full_frame(view)
+        view.draw(0, 0.5)
+    view.draw(0)
+    assert pygame.image.tobytes(view._screen, "RGB") == _full_frame(view)
+
+
+def test_several_ticks_between_frames():
+    """
+    Test that snakes that played more than one tick since the last frame
+    are not interpolated across cells that are never redrawn
+    """
+    game = SnakeGameModel()
+    view = GraphicalView(game, 1400, 1050)
+    game.set_game_state(2)
+    view.draw(0, 0.0)
+    game.move_snakes("UP", "DOWN")
+    game.move_snakes("UP", "DOWN")
+    view.draw(0, 0.5)
+    assert pygame.image.tobytes(view._screen, "RGB") == _full_frame(view)
+
+    # A frame of one tick after the catch up is interpolated again
+    game.move_snakes("UP", "DOWN")
+    view.draw(0, 0.5)
+    assert pygame.image.tobytes(view._screen, "RGB") != _full_frame(view)
+    for _ in range(5):
+        view.draw(0)
+    assert pygame.image.tobytes(view._screen, "RGB") == _full_frame(view)
+
+
+def test_resize_scales_sprites_once():
+    """
+    Test that resizing the window scales the sprites once for the new cell
+    size, not on every frame
+    """
+    game = SnakeGameModel(board_width=40, board_height=30)
+    view = GraphicalView(game, 1400, 1050)
+    assert view._cell_size == 29
+    game.set_game_state(2)
+    view.draw(0)
+
+    # Resizing the window changes the size of the display surface
+    pygame.display.set_mode((700, 525), pygame.RESIZABLE)
+    with patch(
+        "pygame.transform.smoothscale", wraps=pygame.transform.smoothscale
+    ) as smoothscale:
+        view.draw(0)
+        scaled = smoothscale.call_count
+        assert scaled > 0
+        for _ in range(5):
+            game.move_snakes("UP", "DOWN")
+            view.draw(0, 0.5)
+        assert smoothscale.call_count == scaled
+    assert view._cell_size == 14
+    view.draw(0)
+    assert pygame.image.tobytes(view._screen, "RGB") == _full_frame(view)
+
+
+def test_scores_beside_board_in_square_window():
+    """
+    Test that a window too narrow for the board's usual margins still keeps
+    the scores beside the board, so a new score covers the old one
+    """
+    random.seed(3)
+    game = SnakeGameModel()
+    view = GraphicalView(game, 1050, 1050)
+    game.set_game_state(2)
+    view.draw(0)
+    board_left = view._shift
+    for _ in range(300):
+        game.move_snakes(greedy_policy(game, 0), greedy_policy(game, 1))
+        if True in game.snake_won() or game.snake_one.apples_eaten:
+            break
+        game.set_game_state(2)
+        view.draw(0)
+    view.draw(0)
+    assert game.snake_one.apples_eaten > 0
+    for player in (0, 1):
+        _, rect = view._score_sprite(player, game.snakes[player].apples_eaten)
+        assert rect.left >= 0 and rect.right <= view._width
+        assert rect.right <= board_left or rect.left >= 1050 - board_left
+    assert pygame.image.tobytes(view._screen, "RGB") == _full_frame(view)
+
+
+def test_static_screens_drawn_once():
+    """
+    Test that the start and end screens are drawn when they first show or
+    the window is resized, and not again
+    """
+    game = SnakeGameModel()
+    view = GraphicalView(game, 1400, 1050)
+    with patch("pygame.display.update") as update:
+        view.draw(0)
+        assert update.call_count == 1
+        for _ in range(3):
+            view.draw(0)
+        assert update.call_count == 1
+
+        # The end screen is drawn once it shows
+        game.set_game_state(3)
+        view.draw(0)
+        view.draw(0)
+        assert update.call_count == 2
+
+        # Resizing the window draws it again
+        pygame.display.set_mode((700, 525), pygame.RESIZABLE)
+        view.draw(0)
+        view.draw(0)
+        assert update.call_count == 3